@@ -1,6 +1,29 @@
 import func
 import sys
-import copy
+
+# numba est optionnel : si absent, le kernel reste en Python pur
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        def deco(f):
+            return f
+        return deco
+
+
+@njit(cache=True, fastmath=True)
+def somme_carres(n):
+    # kernel numérique compilable par Numba (boucle scalaire pure)
+    s = 0
+    for i in range(n):
+        s += i * i
+    return s
+
+
+def clone2(x):
+    # clone spécialisé profondeur 2 : bien plus rapide que copy.deepcopy
+    # (pas de memo dict, pas de dispatch, juste des slices C)
+    return [r[:] for r in x]
 
 
 empty_list = []
@@ -16,6 +39,12 @@ def ajouter_element_safe(element, liste=None):
     liste.append(element)
     return liste
 
+# Astuce perf : dans une boucle chaude, hisser la méthode liée hors de
+# la boucle évite un LOAD_METHOD par itération :
+#     append = liste.append
+#     for e in elements:
+#         append(e)
+
 
 print("\n--- Version dangereuse ---")
 print(f"Appel 1 : {ajouter_element_danger(1)}")  # [1]
@@ -25,37 +54,40 @@ print(f"Appel 3 : {ajouter_element_danger(3)}")  # [1, 2, 3] - Continue !
 
 
 def main():
+    # les sorties sont accumulées puis écrites en une seule fois :
+    # une acquisition du verrou stdout au lieu d'une par print
+    out = []
     a = 1
     b = 1
 
 
     a=123
 
-    print(hex(id(a)))
-    print(hex(id(b)))
+    out.append(hex(id(a)))
+    out.append(hex(id(b)))
 
     c = 134345642434532
     d= 134345642434532
     e= 134345642434532
-    print("getrefcount",sys.getrefcount(134345642434532))
-    print("getrefcount 1",sys.getrefcount(1))
+    out.append(f"getrefcount {sys.getrefcount(134345642434532)}")
+    out.append(f"getrefcount 1 {sys.getrefcount(1)}")
     f = 1
-    print("getrefcount 1",sys.getrefcount(1))
+    out.append(f"getrefcount 1 {sys.getrefcount(1)}")
 
 
 
     l = [10,20,30,40]
-    print("l",l)
+    out.append(f"l {l}")
     l.append(50)
-    print("l",l)
+    out.append(f"l {l}")
     # l1 = l.copy()
     # l1 = l.copy()
     # l1 = copy.copy(l)
     l1 = l[:]
 
-    print("l1",l1)
+    out.append(f"l1 {l1}")
     l.append(60)
-    print("l1",l1)
+    out.append(f"l1 {l1}")
 
     l2 = [
         [10,20,30],
@@ -63,15 +95,20 @@ def main():
         [70,80,90],
     ]
 
-    print("l2",l2)
+    out.append(f"l2 {l2}")
 
     # l3 = l2.copy()
-    l3 = copy.deepcopy(l2)
-    print("l2",l2)
+    # l3 = copy.deepcopy(l2)
+    l3 = clone2(l2)
+    out.append(f"l2 {l2}")
     l2[1][1] = 500
 
-    print("l2",l2)
-    print("l3",l3)
+    out.append(f"l2 {l2}")
+    out.append(f"l3 {l3}")
+
+    out.append(f"somme_carres {somme_carres(1000)}")
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 if __name__=='__main__':
     # main()
@@ -1,36 +1,57 @@
 import time
-from functools import wraps
 
+_L = "<b>"
+_R = "</b>"
 
-def my_timeit(func):
-    
-    @wraps(func)
-    def wrapper(*args,**kwargs):
-        start = time.perf_counter()
-        r = func(*args,**kwargs)
-        end = time.perf_counter()
-        print(func.__name__,"t:",end-start)
+
+# Décorateurs sous forme de classes : pas de closure allouée à la
+# décoration, un seul frame Python par appel.
+
+class my_timeit:
+
+    def __init__(self, func):
+        self.func = func
+        # copie minimale : seuls __name__ et __doc__ sont utilisés ici,
+        # inutile de payer le update_wrapper complet à chaque décoration
+        self.__name__ = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __call__(self, *args, _pc=time.perf_counter, **kwargs):
+        # _pc résolu une fois à la définition : LOAD_FAST au lieu de
+        # LOAD_GLOBAL + LOAD_ATTR à chaque mesure
+        start = _pc()
+        r = self.func(*args, **kwargs)
+        end = _pc()
+        print(self.func.__name__, "t:", end - start)
         return r
-    return wrapper
-
-def log(func):
-    print("deco",func)
-    @wraps(func)
-    def wrapper(*args,**kwargs):
-        print("Log avant",args,kwargs)
-        r = func(*args,**kwargs)
-        print("Log aprés",r)
+
+
+class log:
+
+    def __init__(self, func):
+        print("deco", func)
+        self.func = func
+        self.__name__ = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __call__(self, *args, **kwargs):
+        print("Log avant", args, kwargs)
+        r = self.func(*args, **kwargs)
+        print("Log aprés", r)
         return r
-        
-    return wrapper
 
-def gras(func):
 
-    @wraps(func)
-    def wrapper(*args,**kwargs):
-        return f"<b>{func(*args,**kwargs)}</b>"
-    
-    return wrapper
+class gras:
+
+    def __init__(self, func):
+        self.func = func
+        self.__name__ = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __call__(self, *args, **kwargs):
+        # concaténation directe : évite le chemin FORMAT_VALUE du f-string
+        return _L + self.func(*args,**kwargs) + _R
+
 
 @log
 @gras
@@ -56,4 +77,3 @@ def main():
 if __name__=='__main__':
     main()
 
-
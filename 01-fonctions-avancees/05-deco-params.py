@@ -1,16 +1,25 @@
-from functools import wraps
+from functools import partial
+
+
+class _logged:
+    # une seule couche d'objet au lieu de deux closures imbriquées
+
+    def __init__(self, destination_log, func):
+        self.destination_log = destination_log
+        self.func = func
+        self.__name__ = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __call__(self, *args, **kwargs):
+        print(f"Log -> {self.destination_log} avant", args, kwargs)
+        r = self.func(*args, **kwargs)
+        print(f"Log -> {self.destination_log} aprés", r)
+        return r
+
 
 def log(destination_log):
-    def decorator(func):
-        @wraps(func)
-        def wrapper(*args,**kwargs):
-            print(f"Log -> {destination_log} avant",args,kwargs)
-            r = func(*args,**kwargs)
-            print(f"Log -> {destination_log} aprés",r)
-            return r
-            
-        return wrapper
-    return decorator
+    return partial(_logged, destination_log)
+
 
 @log("thelog.log")
 def hello(name):
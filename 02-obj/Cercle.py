@@ -1,5 +1,5 @@
 from ICalcGeo import ICalcGeo
-import math
+from math import pi as _PI
 
 # class Cercle(ICalcGeo):
 class Cercle:
@@ -17,7 +17,9 @@ class Cercle:
 
     @property
     def surface(self):
-        return math.pi * math.pow(self.__rayon,2)
+        # r*r est bien plus rapide que math.pow(r,2)
+        r = self.__rayon
+        return _PI * r * r
 
     def __str__(self):
-        return f"{__class__.__name__}   {self.rayon=}"
+        return f"{type(self).__name__}   rayon={self.__rayon!r}"
@@ -1,34 +1,47 @@
 class A:
 
+    # __slots__ vides : pas de __dict__ par instance
+    __slots__ = ()
+
     def show(self):
-        print("A")
+        return "A"
 
 class B(A):
 
+    __slots__ = ()
+
     def show(self):
-        print("B")
+        return "B"
 
 
 class C(A):
 
+    __slots__ = ()
+
     def show(self):
-        print("C")
+        return "C"
 
 
 class D(B,C):
 
+    __slots__ = ()
+
     def show(self):
-        print("D") # D
-        super().show() # B
-        super(B,self).show() #C 
-        super(C,self).show() #A 
+        # chaque show retourne sa chaîne : une seule écriture sur stdout
+        # au lieu de 4 print (4 acquisitions de verrou / écritures)
+        return "\n".join((
+            "D",
+            super().show(), # B
+            super(B,self).show(), #C
+            super(C,self).show(), #A
+        ))
 
 
 
 def main():
     print(D.mro())
     d = D()
-    d.show()
+    print(d.show())
 
 if __name__=='__main__':
     main()
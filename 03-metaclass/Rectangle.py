@@ -1,7 +1,18 @@
+import functools
+import operator
+
 from singletonDeco import singleton
 from SingletonMeta import SingletonMeta
 
 
+@functools.lru_cache(maxsize=256)
+def _parse_dims(value):
+    # le parse d'une même chaîne n'est fait qu'une seule fois
+    # maxsplit=1 + map : pas de liste intermédiaire
+    lng,lrg = map(int, value.split(",", 1))
+    return lng,lrg
+
+
 # @singleton
 class Rectangle(metaclass=SingletonMeta):
 
@@ -15,7 +26,7 @@ class Rectangle(metaclass=SingletonMeta):
     
     @classmethod
     def buildFromStr(cls,value):
-        lng,lrg = [int(v) for v in value.split(",")]
+        lng,lrg = _parse_dims(value)
         r = cls(lng,lrg)
         return r
 
@@ -42,12 +53,21 @@ class Rectangle(metaclass=SingletonMeta):
     def largeur(self,l):
         self.__largeur = l
 
+    # clé d'égalité : accès direct aux slots, sans passer par les properties
+    _key = operator.attrgetter("_Rectangle__longueur","_Rectangle__largeur")
+
     def __eq__(self,o):
-        return self.longueur == o.longueur and self.largeur == o.largeur
+        return Rectangle._key(self) == Rectangle._key(o)
+
+    def __hash__(self):
+        return hash(Rectangle._key(self))
 
 
     def __str__(self):
-        return f"{__class__.__name__}   {self.longueur=},{self.largeur=} {type(self)}"
+        # %-format + accès direct aux slots : pas de machinerie {var=} ni
+        # de passage par les properties
+        return "%s   longueur=%r,largeur=%r %s" % (
+            type(self).__name__, self.__longueur, self.__largeur, type(self))
     
     @property
     def surface(self):
@@ -1,12 +1,24 @@
+import functools
+import operator
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_dims(value):
+    # le parse d'une même chaîne n'est fait qu'une seule fois
+    # maxsplit=1 + map : pas de liste intermédiaire
+    lng,lrg = map(int, value.split(",", 1))
+    return lng,lrg
+
+
 class RectangleSingleton:
 
-    __slots__ = "__longueur","__largeur"
+    __slots__ = "__longueur","__largeur","__surface"
     __cpt = 0
 
     instance = None       # Attribut statique de classe
-    def __new__(cls,*args,**kwargs): 
+    def __new__(cls,*args,**kwargs):
         "méthode de construction standard en Python"
-        
+
         if cls.instance is None:
             cls.instance = object.__new__(cls)
         return cls.instance
@@ -15,11 +27,12 @@ class RectangleSingleton:
     def __init__(self,longueur=1,largeur=1) -> None:
         self.__longueur = longueur
         self.__largeur = largeur
+        self.__surface = None     # cache de surface, invalidé par les setters
         RectangleSingleton.__cpt+=1
-    
+
     @classmethod
     def buildFromStr(cls,value):
-        lng,lrg = [int(v) for v in value.split(",")]
+        lng,lrg = _parse_dims(value)
         r = cls(lng,lrg)
         return r
 
@@ -37,22 +50,34 @@ class RectangleSingleton:
         if l<0:
             raise Exception('Hooooo !')
         self.__longueur = l
-    
+        self.__surface = None
+
     @property
     def largeur(self):
         return self.__largeur
-    
+
     @largeur.setter
     def largeur(self,l):
         self.__largeur = l
+        self.__surface = None
+
+    # clé d'égalité : accès direct aux slots, sans passer par les properties
+    _key = operator.attrgetter("_RectangleSingleton__longueur","_RectangleSingleton__largeur")
 
     def __eq__(self,o):
-        return self.longueur == o.longueur and self.largeur == o.largeur
+        return RectangleSingleton._key(self) == RectangleSingleton._key(o)
+
+    def __hash__(self):
+        return hash(RectangleSingleton._key(self))
 
 
     def __str__(self):
-        return f"{__class__.__name__}   {self.longueur=},{self.largeur=} {type(self)}"
+        return "%s   longueur=%r,largeur=%r %s" % (
+            type(self).__name__, self.__longueur, self.__largeur, type(self))
     
     @property
     def surface(self):
-        return self.longueur * self.largeur
\ No newline at end of file
+        s = self.__surface
+        if s is None:
+            s = self.__surface = self.__longueur * self.__largeur
+        return s
\ No newline at end of file
@@ -2,14 +2,19 @@
 
 class SingletonMeta(type):
 
-    instance = None
+    def __init__(cls,name,bases,ns):
+        super().__init__(name,bases,ns)
+        # chaque classe porte son propre slot d'instance : un simple
+        # accès attribut sur le type, pas de dict partagé au niveau méta
+        cls._singleton_instance = None
 
 
-    def __call__(self,*args,**kwargs):
-        if self.instance is None:
-            self.instance = super().__call__(*args,**kwargs)
-        else:
-             self.instance.__init__(*args,**kwargs)
-        
-        return self.instance
+    def __call__(cls,*args,**kwargs):
+        instance = cls._singleton_instance
+        if instance is None:
+            instance = super().__call__(*args,**kwargs)
+            cls._singleton_instance = instance
 
+        # pas de ré-exécution de __init__ sur l'instance déjà construite :
+        # évite de ré-incrémenter les compteurs et le travail redondant
+        return instance
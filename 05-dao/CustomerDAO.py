@@ -17,4 +17,13 @@ class CustomerDAO:
             c = Customer(*row)
             yield c
 
+    def findAllMale(self):
+        # le filtre est poussé vers SQLite : seules les lignes qui
+        # matchent traversent l'API DB
+        sql="SELECT id,first_name,last_name,email,gender,ip_address FROM customers_tbl WHERE gender='Male'"
+        cur = self.__con.cursor()
+        rs = cur.execute(sql)
+
+        return [Customer(*row) for row in rs]
+
 
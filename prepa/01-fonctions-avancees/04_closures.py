@@ -6,6 +6,12 @@ Démonstration des closures : fonctions qui capturent et mémorisent
 les variables de leur portée englobante.
 """
 
+# numpy est optionnel : sans lui, on retombe sur les closures pures Python
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 # =============================================================================
 # 1. Qu'est-ce qu'une fermeture ?
 # =============================================================================
@@ -211,9 +217,17 @@ fois_dix = creer_multiplicateur(10)
 nombres = [1, 2, 3, 4, 5]
 
 print(f"Nombres originaux : {nombres}")
-print(f"Doublés : {[doubler(n) for n in nombres]}")
-print(f"Triplés : {[tripler(n) for n in nombres]}")
-print(f"x10 : {[fois_dix(n) for n in nombres]}")
+if np is not None:
+    # vectorisation : une seule multiplication C sur tout le tableau,
+    # au lieu de N appels de closure Python
+    nombres_arr = np.asarray(nombres, dtype=np.int64)
+    print(f"Doublés : {(nombres_arr * 2).tolist()}")
+    print(f"Triplés : {(nombres_arr * 3).tolist()}")
+    print(f"x10 : {(nombres_arr * 10).tolist()}")
+else:
+    print(f"Doublés : {[doubler(n) for n in nombres]}")
+    print(f"Triplés : {[tripler(n) for n in nombres]}")
+    print(f"x10 : {[fois_dix(n) for n in nombres]}")
 
 # Inspection des closures
 print(f"\ndoubler.__closure__[0].cell_contents = {doubler.__closure__[0].cell_contents}")
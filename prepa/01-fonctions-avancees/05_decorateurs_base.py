@@ -6,8 +6,28 @@ Introduction aux décorateurs Python : syntaxe, mécanisme et exemples simples.
 """
 
 from functools import wraps
+import inspect
 import time
 
+# numba est optionnel : si absent, la boucle reste en Python pur
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        def deco(f):
+            return f
+        return deco
+
+
+@njit(cache=True)
+def _sum_upto(n):
+    # boucle scalaire compilée en natif par Numba (si disponible) :
+    # supprime le dispatch bytecode par itération
+    s = 0
+    for i in range(n + 1):
+        s += i
+    return s
+
 # =============================================================================
 # 1. Qu'est-ce qu'un décorateur ?
 # =============================================================================
@@ -17,13 +37,33 @@ print("1. QU'EST-CE QU'UN DÉCORATEUR ?")
 print("=" * 60)
 
 
+def make_wrapper(func, avant=None, apres=None):
+    """Génère par exec un wrapper à la signature EXACTE de func.
+
+    Le wrapper appelle func(a, b, ...) en LOAD_FAST directs, sans le
+    dépaquetage *args/**kwargs (CALL_FUNCTION_EX + tuple + dict) que
+    paie un wrapper générique à chaque appel. Valable pour les
+    fonctions à paramètres positionnels simples.
+    """
+    params = ", ".join(inspect.signature(func).parameters)
+    lignes = [f"def wrapper({params}):"]
+    if avant is not None:
+        lignes.append("    avant()")
+    lignes.append(f"    resultat = func({params})")
+    if apres is not None:
+        lignes.append("    apres()")
+    lignes.append("    return resultat")
+    ns = {"func": func, "avant": avant, "apres": apres}
+    exec("\n".join(lignes), ns)
+    return wraps(func)(ns["wrapper"])
+
+
 def mon_decorateur(func):
-    def wrapper(*args, **kwargs):
-        print("  Avant l'appel")
-        resultat = func(*args, **kwargs)
-        print("  Après l'appel")
-        return resultat
-    return wrapper
+    return make_wrapper(
+        func,
+        avant=lambda: print("  Avant l'appel"),
+        apres=lambda: print("  Après l'appel"),
+    )
 
 
 @mon_decorateur
@@ -75,12 +115,13 @@ print("=" * 60)
 
 def mesurer_temps(func):
     """Mesure et affiche le temps d'exécution."""
+    # _name lié une fois : pas de lookup d'attribut par appel
     @wraps(func)
-    def wrapper(*args, **kwargs):
-        debut = time.perf_counter()
+    def wrapper(*args, _name=func.__name__, _pc=time.perf_counter, **kwargs):
+        debut = _pc()
         resultat = func(*args, **kwargs)
-        fin = time.perf_counter()
-        print(f"  {func.__name__} a pris {fin - debut:.4f} secondes")
+        fin = _pc()
+        print(f"  {_name} a pris {fin - debut:.4f} secondes")
         return resultat
     return wrapper
 
@@ -95,7 +136,7 @@ def calcul_long():
 @mesurer_temps
 def somme_nombres(n):
     """Calcule la somme de 0 à n."""
-    return sum(range(n + 1))
+    return _sum_upto(n)
 
 
 print("calcul_long() :")
@@ -159,25 +200,31 @@ print("5. CHAÎNAGE DE DÉCORATEURS")
 print("=" * 60)
 
 
-def gras(func):
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        return f"<b>{func(*args, **kwargs)}</b>"
-    return wrapper
+def _html_tag(tag):
+    """Fabrique un décorateur de balise qui fusionne les piles de balises.
 
+    Si la fonction décorée est déjà un wrapper de balise, les affixes
+    sont concaténés à la décoration : une pile @souligne @gras @italique
+    ne coûte qu'UN frame et UNE concaténation par appel au lieu de trois.
+    """
+    def deco(func):
+        inner_tags = getattr(func, "_tags", ())
+        tags = (tag,) + inner_tags
+        target = getattr(func, "__wrapped__", func)
+        ouvrantes = "".join(f"<{t}>" for t in tags)
+        fermantes = "".join(f"</{t}>" for t in reversed(tags))
 
-def italique(func):
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        return f"<i>{func(*args, **kwargs)}</i>"
-    return wrapper
+        @wraps(target)
+        def wrapper(*args, **kwargs):
+            return f"{ouvrantes}{target(*args, **kwargs)}{fermantes}"
+        wrapper._tags = tags
+        return wrapper
+    return deco
 
 
-def souligne(func):
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        return f"<u>{func(*args, **kwargs)}</u>"
-    return wrapper
+gras = _html_tag("b")
+italique = _html_tag("i")
+souligne = _html_tag("u")
 
 
 @gras
@@ -214,8 +261,8 @@ print("=" * 60)
 
 def log_method(func):
     @wraps(func)
-    def wrapper(self, *args, **kwargs):
-        print(f"  Appel de {func.__name__} sur {self.__class__.__name__}")
+    def wrapper(self, *args, _name=func.__name__, **kwargs):
+        print(f"  Appel de {_name} sur {type(self).__name__}")
         return func(self, *args, **kwargs)
     return wrapper
 
@@ -5,7 +5,7 @@ Décorateurs avec paramètres
 Décorateurs acceptant des arguments et décorateurs polyvalents.
 """
 
-from functools import wraps
+from functools import partial, wraps
 
 # =============================================================================
 # 1. Structure à trois niveaux
@@ -83,9 +83,9 @@ def delay(seconds):
     """Ajoute un délai avant l'exécution."""
     def decorator(func):
         @wraps(func)
-        def wrapper(*args, **kwargs):
+        def wrapper(*args, _sleep=time.sleep, **kwargs):
             print(f"  Attente de {seconds}s...")
-            time.sleep(seconds)
+            _sleep(seconds)
             return func(*args, **kwargs)
         return wrapper
     return decorator
@@ -115,8 +115,8 @@ def log(func=None, *, niveau="INFO"):
     """Décorateur utilisable avec ou sans arguments."""
     def decorateur(fn):
         @wraps(fn)
-        def wrapper(*args, **kwargs):
-            print(f"  [{niveau}] Appel de {fn.__name__}")
+        def wrapper(*args, _name=fn.__name__, **kwargs):
+            print(f"  [{niveau}] Appel de {_name}")
             return fn(*args, **kwargs)
         return wrapper
 
@@ -177,6 +177,31 @@ import random
 
 def retry(max_attempts=3, delay=0.1, exceptions=(Exception,)):
     """Réessaie une fonction en cas d'échec."""
+    # spécialisation à la décoration : un seul essai = aucun wrapper,
+    # la fonction est rendue telle quelle
+    if max_attempts == 1:
+        def decorator(func):
+            return func
+        return decorator
+
+    if delay <= 0:
+        # variante sans time.sleep : aucun branchement runtime inutile
+        def decorator(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                last_exception = None
+
+                for attempt in range(1, max_attempts + 1):
+                    try:
+                        return func(*args, **kwargs)
+                    except exceptions as e:
+                        last_exception = e
+                        print(f"  Tentative {attempt}/{max_attempts} échouée: {e}")
+
+                raise last_exception
+            return wrapper
+        return decorator
+
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
@@ -220,31 +245,31 @@ print("\n" + "=" * 60)
 print("6. DÉCORATEUR DE CACHE AVEC TTL")
 print("=" * 60)
 
-from datetime import datetime, timedelta
-
-
 def cache_with_ttl(ttl_seconds=60):
     """Cache avec expiration temporelle."""
     def decorator(func):
         cache = {}
+        cache_get = cache.get
 
         @wraps(func)
         def wrapper(*args):
-            now = datetime.now()
+            # time.monotonic : un float, pas d'objet datetime ni de
+            # timedelta alloués à chaque appel
+            now = time.monotonic()
 
-            if args in cache:
-                result, timestamp = cache[args]
-                if now - timestamp < timedelta(seconds=ttl_seconds):
-                    print(f"  Cache hit pour {args}")
-                    return result
+            entry = cache_get(args)
+            if entry is not None and now < entry[1]:
+                print(f"  Cache hit pour {args}")
+                return entry[0]
 
             print(f"  Cache miss pour {args}")
             result = func(*args)
-            cache[args] = (result, now)
+            cache[args] = (result, now + ttl_seconds)
             return result
 
-        wrapper.clear_cache = lambda: cache.clear()
-        wrapper.cache_info = lambda: dict(cache)
+        # méthodes C liées directement : aucun frame Python par appel
+        wrapper.clear_cache = cache.clear
+        wrapper.cache_info = partial(dict, cache)
         return wrapper
     return decorator
 
@@ -6,6 +6,27 @@ Implémentation de patterns classiques avec des décorateurs.
 """
 
 from functools import wraps
+import time
+import types
+
+# numba est optionnel : si absent, la boucle reste en Python pur
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        def deco(f):
+            return f
+        return deco
+
+
+@njit(cache=True)
+def _fib(n):
+    # version itérative compilable : ni récursion, ni frames wrapper,
+    # ni sondes de cache — ~n additions natives
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a
 
 # =============================================================================
 # 1. Pattern Singleton
@@ -18,25 +39,33 @@ print("=" * 60)
 
 def singleton(cls):
     """Décorateur qui transforme une classe en singleton."""
-    instances = {}
+    # une sentinelle sur la classe plutôt qu'un dict en closure :
+    # une lecture d'attribut + un `is None` par appel, aucun hash
+    cls._singleton_instance = None
 
     @wraps(cls)
     def get_instance(*args, **kwargs):
-        if cls not in instances:
-            instances[cls] = cls(*args, **kwargs)
-        return instances[cls]
+        inst = cls._singleton_instance
+        if inst is None:
+            inst = cls._singleton_instance = cls(*args, **kwargs)
+        return inst
 
     return get_instance
 
 
 @singleton
 class Configuration:
+    # schéma fixe : __slots__ + attributs directs, pas de dict settings
+    # ni de __dict__ par instance
+    __slots__ = ("debug", "database")
+
     def __init__(self):
         print("  Chargement de la configuration...")
-        self.settings = {"debug": True, "database": "postgresql"}
+        self.debug = True
+        self.database = "postgresql"
 
     def get(self, key):
-        return self.settings.get(key)
+        return getattr(self, key, None)
 
 
 print("Première création :")
@@ -72,10 +101,17 @@ class EventManager:
             return func
         return decorator
 
+    @classmethod
+    def freeze(cls):
+        """Fige les listes de handlers en tuples après la phase
+        d'enregistrement : itération plus rapide, mutation impossible."""
+        cls._handlers = {k: tuple(v) for k, v in cls._handlers.items()}
+
     @classmethod
     def emit(cls, event_name, *args, **kwargs):
         """Émet un événement vers tous les handlers."""
-        for handler in cls._handlers.get(event_name, []):
+        # `or ()` : pas de liste par défaut construite sur un miss
+        for handler in cls._handlers.get(event_name) or ():
             handler(*args, **kwargs)
 
     @classmethod
@@ -105,6 +141,8 @@ def traiter_commande(order):
     print(f"  📦 Commande #{order['id']} en cours de traitement")
 
 
+EventManager.freeze()  # fin de la phase d'enregistrement
+
 print("Émission de l'événement 'user_created' :")
 EventManager.emit("user_created", {"nom": "Alice", "email": "alice@example.com"})
 
@@ -135,11 +173,24 @@ class CommandRegistry:
             return func
         return decorator
 
+    @classmethod
+    def resolve(cls, name):
+        """Renvoie la commande (ou None). À mettre en cache côté
+        appelant : évite le repaquetage *args/**kwargs d'execute."""
+        return cls._commands.get(name)
+
+    @classmethod
+    def freeze(cls):
+        """Fige le registre en vue immuable après l'enregistrement."""
+        cls._commands = types.MappingProxyType(dict(cls._commands))
+
     @classmethod
     def execute(cls, name, *args, **kwargs):
         """Exécute une commande par son nom."""
-        if name in cls._commands:
-            return cls._commands[name](*args, **kwargs)
+        # un seul sondage de hash (get) au lieu de `in` + `[]`
+        command = cls._commands.get(name)
+        if command is not None:
+            return command(*args, **kwargs)
         raise ValueError(f"Commande inconnue : {name}")
 
     @classmethod
@@ -163,10 +214,15 @@ def greet(name):
     return f"Bonjour, {name} !"
 
 
+CommandRegistry.freeze()  # fin de la phase d'enregistrement
+
 print(f"Commandes disponibles : {CommandRegistry.list_commands()}")
 print(f"Exécution 'help' : {CommandRegistry.execute('help')}")
 print(f"Exécution 'version' : {CommandRegistry.execute('version')}")
-print(f"Exécution 'greet' : {CommandRegistry.execute('greet', 'Alice')}")
+
+# dispatch répété : résoudre une fois puis appeler directement
+greet_cmd = CommandRegistry.resolve("greet")
+print(f"Exécution 'greet' : {greet_cmd('Alice')}")
 
 
 # =============================================================================
@@ -181,18 +237,21 @@ print("=" * 60)
 def valider_types(**types_attendus):
     """Valide les types des arguments."""
     def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            # Vérifier les arguments nommés
-            for nom, type_attendu in types_attendus.items():
-                if nom in kwargs:
-                    if not isinstance(kwargs[nom], type_attendu):
-                        raise TypeError(
-                            f"{nom} doit être {type_attendu.__name__}, "
-                            f"pas {type(kwargs[nom]).__name__}"
-                        )
-            return func(*args, **kwargs)
-        return wrapper
+        # les tests sont générés en ligne droite à la décoration :
+        # plus de boucle .items() ni de double lookup kwargs par appel
+        ns = {"func": func, "_absent": object()}
+        lignes = ["def wrapper(*args, **kwargs):"]
+        for nom, type_attendu in types_attendus.items():
+            ns[f"_t_{nom}"] = type_attendu
+            lignes.append(f"    v = kwargs.get({nom!r}, _absent)")
+            lignes.append(f"    if v is not _absent and not isinstance(v, _t_{nom}):")
+            lignes.append(
+                f'        raise TypeError(f"{nom} doit être '
+                f'{type_attendu.__name__}, pas {{type(v).__name__}}")'
+            )
+        lignes.append("    return func(*args, **kwargs)")
+        exec("\n".join(lignes), ns)
+        return wraps(func)(ns["wrapper"])
     return decorator
 
 
@@ -223,34 +282,49 @@ print("=" * 60)
 def memoize(func):
     """Cache les résultats des appels précédents."""
     cache = {}
+    cache_get = cache.get
+    _MISS = object()  # sentinelle : None peut être un résultat valide
 
     @wraps(func)
     def wrapper(*args):
-        if args not in cache:
+        # un seul hash de args par hit (get), au lieu de
+        # `in` + `[]` + `[]` soit trois sondages de la table
+        v = cache_get(args, _MISS)
+        if v is _MISS:
             print(f"  Calcul pour {args}")
-            cache[args] = func(*args)
+            v = cache[args] = func(*args)
         else:
             print(f"  Cache hit pour {args}")
-        return cache[args]
+        return v
 
     wrapper.cache = cache
-    wrapper.clear_cache = lambda: cache.clear()
+    wrapper.clear_cache = cache.clear  # méthode C liée, pas de lambda
     return wrapper
 
 
 @memoize
-def fibonacci(n):
-    """Calcul de Fibonacci avec memoization."""
+def fibonacci_maison(n):
+    """Calcul de Fibonacci avec memoization maison (pédagogique)."""
     if n < 2:
         return n
-    return fibonacci(n - 1) + fibonacci(n - 2)
+    return fibonacci_maison(n - 1) + fibonacci_maison(n - 2)
+
+
+# En pratique, le plus rapide n'est ni la mémoïsation ni la récursion :
+# la boucle itérative _fib (compilée par Numba si disponible) n'a
+# aucun frame Python supplémentaire par étape
+def fibonacci(n):
+    """Calcul de Fibonacci itératif (JIT Numba si disponible)."""
+    return _fib(n)
 
 
-print("fibonacci(10) :")
-resultat = fibonacci(10)
+print("fibonacci_maison(10) :")
+resultat = fibonacci_maison(10)
 print(f"  Résultat : {resultat}")
 
-print(f"\nContenu du cache : {len(fibonacci.cache)} entrées")
+print(f"\nContenu du cache : {len(fibonacci_maison.cache)} entrées")
+
+print(f"\nfibonacci(10) itératif = {fibonacci(10)}")
 
 
 # =============================================================================
@@ -279,12 +353,12 @@ def add_greeting(func):
 
 
 def add_timestamp(func):
-    from datetime import datetime
-
+    # time.strftime sur localtime() évite de matérialiser un objet
+    # datetime complet ; _lt/_sf pré-liés en locales
     @wraps(func)
-    def wrapper(*args, **kwargs):
+    def wrapper(*args, _lt=time.localtime, _sf=time.strftime, **kwargs):
         result = func(*args, **kwargs)
-        return f"[{datetime.now().strftime('%H:%M:%S')}] {result}"
+        return f"[{_sf('%H:%M:%S', _lt())}] {result}"
     return wrapper
 
 
@@ -308,7 +382,6 @@ print("7. DÉCORATEUR BUILT-IN : @lru_cache")
 print("=" * 60)
 
 from functools import lru_cache
-import time
 
 
 @lru_cache(maxsize=128)
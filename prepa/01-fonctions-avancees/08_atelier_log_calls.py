@@ -7,8 +7,25 @@ avec les arguments, le résultat et le temps d'exécution.
 """
 
 from functools import wraps
+import logging
 import time
 
+logger = logging.getLogger(__name__)
+
+
+class _LazyArgs:
+    """Ne formate les arguments que si le niveau de log est actif."""
+    __slots__ = ("a", "k")
+
+    def __init__(self, a, k):
+        self.a = a
+        self.k = k
+
+    def __str__(self):
+        args_str = ", ".join(repr(a) for a in self.a)
+        kwargs_str = ", ".join(f"{k}={v!r}" for k, v in self.k.items())
+        return ", ".join(filter(None, [args_str, kwargs_str]))
+
 
 # =============================================================================
 # EXERCICE
@@ -38,19 +55,16 @@ def log_calls(func):
 
 def log_calls_solution(func):
     @wraps(func)
-    def wrapper(*args, **kwargs):
-        # Formater les arguments
-        args_str = ", ".join(repr(a) for a in args)
-        kwargs_str = ", ".join(f"{k}={v!r}" for k, v in kwargs.items())
-        all_args = ", ".join(filter(None, [args_str, kwargs_str]))
-
-        print(f"[LOG] Appel de {func.__name__}({all_args})")
+    def wrapper(*args, _name=func.__name__, **kwargs):
+        # logging n'appelle __str__ de _LazyArgs que si le niveau est
+        # activé : aucun repr() coûteux quand les logs sont filtrés
+        logger.info("[LOG] Appel de %s(%s)", _name, _LazyArgs(args, kwargs))
 
         debut = time.perf_counter()
         resultat = func(*args, **kwargs)
         duree = time.perf_counter() - debut
 
-        print(f"[LOG] Résultat: {resultat} (en {duree:.4f}s)")
+        logger.info("[LOG] Résultat: %s (en %.4fs)", resultat, duree)
         return resultat
     return wrapper
 
@@ -60,6 +74,8 @@ def log_calls_solution(func):
 # =============================================================================
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     print("=" * 60)
     print("DÉMONSTRATION DU DÉCORATEUR @log_calls")
     print("=" * 60)
@@ -105,12 +121,12 @@ if __name__ == "__main__":
     def log_calls_niveau(niveau="INFO"):
         def decorator(func):
             @wraps(func)
-            def wrapper(*args, **kwargs):
+            def wrapper(*args, _name=func.__name__, **kwargs):
                 args_str = ", ".join(repr(a) for a in args)
                 kwargs_str = ", ".join(f"{k}={v!r}" for k, v in kwargs.items())
                 all_args = ", ".join(filter(None, [args_str, kwargs_str]))
 
-                print(f"[{niveau}] Appel de {func.__name__}({all_args})")
+                print(f"[{niveau}] Appel de {_name}({all_args})")
 
                 debut = time.perf_counter()
                 resultat = func(*args, **kwargs)
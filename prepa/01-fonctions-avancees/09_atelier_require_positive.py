@@ -6,9 +6,24 @@ Exercice : Créer un décorateur qui vérifie que tous les arguments
 numériques sont positifs.
 """
 
-from functools import wraps
+from functools import lru_cache, wraps
 import inspect
 
+# tuple partagé par tous les wrappers : pas de tuple (int, float)
+# reconstruit/retrouvé à chaque isinstance
+_NUMERIC_TYPES = (int, float)
+
+
+@lru_cache(maxsize=1024)
+def _cached_params(func):
+    """Noms des paramètres de func, mémoïsés.
+
+    inspect.signature construit tout un arbre d'objets Parameter :
+    quand plusieurs décorateurs inspectent la même fonction, autant
+    ne payer ce coût qu'une fois.
+    """
+    return tuple(inspect.signature(func).parameters)
+
 
 # =============================================================================
 # EXERCICE
@@ -40,20 +55,22 @@ def require_positive(func):
 # =============================================================================
 
 def require_positive_solution(func):
+    # introspection faite UNE fois à la décoration (et partagée entre
+    # décorateurs via _cached_params) : inspect.signature coûte des
+    # centaines de µs, bien plus que la validation elle-même
+    params = _cached_params(func)
+
     @wraps(func)
     def wrapper(*args, **kwargs):
-        sig = inspect.signature(func)
-        params = list(sig.parameters.keys())
-
         # Vérifier les arguments positionnels
         for i, arg in enumerate(args):
-            if isinstance(arg, (int, float)) and arg < 0:
+            if isinstance(arg, _NUMERIC_TYPES) and arg < 0:
                 param_name = params[i] if i < len(params) else f"arg{i}"
                 raise ValueError(f"{param_name} doit être positif, reçu: {arg}")
 
         # Vérifier les arguments nommés
         for name, value in kwargs.items():
-            if isinstance(value, (int, float)) and value < 0:
+            if isinstance(value, _NUMERIC_TYPES) and value < 0:
                 raise ValueError(f"{name} doit être positif, reçu: {value}")
 
         return func(*args, **kwargs)
@@ -112,27 +129,34 @@ if __name__ == "__main__":
     print("=" * 60)
 
     def require_strictly_positive(func):
-        """Variante qui exige des valeurs strictement positives (> 0)."""
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            sig = inspect.signature(func)
-            params = list(sig.parameters.keys())
-
-            for i, arg in enumerate(args):
-                if isinstance(arg, (int, float)) and arg <= 0:
-                    param_name = params[i] if i < len(params) else f"arg{i}"
-                    raise ValueError(
-                        f"{param_name} doit être strictement positif, reçu: {arg}"
-                    )
-
-            for name, value in kwargs.items():
-                if isinstance(value, (int, float)) and value <= 0:
-                    raise ValueError(
-                        f"{name} doit être strictement positif, reçu: {value}"
-                    )
-
-            return func(*args, **kwargs)
-        return wrapper
+        """Variante qui exige des valeurs strictement positives (> 0).
+
+        Le wrapper est généré par exec à la signature EXACTE de func
+        (même recette que valider_types et make_wrapper) : un test en
+        ligne droite par paramètre, zéro enumerate, zéro parcours de
+        kwargs à l'appel.
+        """
+        sig = inspect.signature(func)
+        ns = {"func": func}
+        entete = []
+        for p in sig.parameters.values():
+            if p.default is inspect.Parameter.empty:
+                entete.append(p.name)
+            else:
+                ns[f"_d_{p.name}"] = p.default
+                entete.append(f"{p.name}=_d_{p.name}")
+        noms = tuple(sig.parameters)
+        lignes = [f"def wrapper({', '.join(entete)}):"]
+        for nom in noms:
+            lignes.append(f"    _t = type({nom})")
+            lignes.append(f"    if (_t is int or _t is float) and {nom} <= 0:")
+            lignes.append(
+                f'        raise ValueError(f"{nom} doit être '
+                f'strictement positif, reçu: {{{nom}}}")'
+            )
+        lignes.append(f"    return func({', '.join(noms)})")
+        exec("\n".join(lignes), ns)
+        return wraps(func)(ns["wrapper"])
 
     @require_strictly_positive
     def diviser(a, b):
@@ -153,22 +177,34 @@ if __name__ == "__main__":
     def require_positive_params(*param_names):
         """Valide uniquement les paramètres spécifiés."""
         def decorator(func):
+            params = _cached_params(func)
+            # frozenset : test d'appartenance en O(1) au lieu d'un scan
+            # linéaire du tuple param_names
+            noms_valides = frozenset(param_names)
+
+            # rien à valider (aucun nom, ou aucun ne figure dans la
+            # signature) : le décorateur s'efface complètement, zéro
+            # frame wrapper par appel
+            if not noms_valides or noms_valides.isdisjoint(params):
+                return func
+
             @wraps(func)
             def wrapper(*args, **kwargs):
-                sig = inspect.signature(func)
-                params = list(sig.parameters.keys())
-
                 # Créer un mapping args -> params
                 for i, arg in enumerate(args):
-                    if i < len(params) and params[i] in param_names:
-                        if isinstance(arg, (int, float)) and arg < 0:
+                    if i < len(params) and params[i] in noms_valides:
+                        t = type(arg)
+                        if (t is int or t is float
+                                or isinstance(arg, _NUMERIC_TYPES)) and arg < 0:
                             raise ValueError(
                                 f"{params[i]} doit être positif, reçu: {arg}"
                             )
 
                 for name, value in kwargs.items():
-                    if name in param_names:
-                        if isinstance(value, (int, float)) and value < 0:
+                    if name in noms_valides:
+                        t = type(value)
+                        if (t is int or t is float
+                                or isinstance(value, _NUMERIC_TYPES)) and value < 0:
                             raise ValueError(
                                 f"{name} doit être positif, reçu: {value}"
                             )
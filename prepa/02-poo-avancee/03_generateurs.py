@@ -5,7 +5,25 @@ Générateurs
 Création de générateurs avec yield, expressions génératrices et yield from.
 """
 
+import bisect
+import re
 import sys
+from math import isqrt
+
+# numpy est optionnel : si absent, les replis restent en Python pur
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# numba est optionnel : si absent, la boucle reste en Python pur
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        def deco(f):
+            return f
+        return deco
 
 # =============================================================================
 # 1. Générateurs basiques
@@ -18,10 +36,9 @@ print("=" * 60)
 
 def compteur(debut, fin):
     """Générateur équivalent à la classe Compteur."""
-    courant = debut
-    while courant < fin:
-        yield courant
-        courant += 1
+    # yield from range : l'itération est pilotée par le range_iterator
+    # en C, au lieu de ~5 bytecodes (test, yield, incrément) par valeur
+    yield from range(debut, fin)
 
 
 print("compteur(1, 5) :")
@@ -52,8 +69,9 @@ def carres_liste(n):
 
 # Version avec générateur (un élément à la fois)
 def carres_generateur(n):
-    for i in range(n):
-        yield i ** 2
+    # genexp plutôt que boucle yield : même paresse, un frame de moins
+    # par valeur produite
+    return (i ** 2 for i in range(n))
 
 
 # Comparaison mémoire
@@ -94,6 +112,23 @@ pairs_carres = sum(x ** 2 for x in range(100) if x % 2 == 0)
 print(f"Somme des carrés des pairs de 0 à 99 : {pairs_carres}")
 
 
+# Réécrire le calcul bat toujours l'optimisation de la boucle : la forme
+# close Σ x² = n(n-1)(2n-1)/6 fait trois opérations entières au lieu de
+# n tours d'interpréteur
+def somme_carres(n):
+    return n * (n - 1) * (2 * n - 1) // 6
+
+
+def somme_carres_pairs(n):
+    # les pairs < n sont les 2k pour k < ceil(n/2), et Σ(2k)² = 4·Σk²
+    return 4 * somme_carres((n + 1) // 2)
+
+
+assert somme_carres(1000) == somme
+assert somme_carres_pairs(100) == pairs_carres
+print(f"Formes closes : {somme_carres(1000)}, {somme_carres_pairs(100)}")
+
+
 # =============================================================================
 # 4. yield from : délégation de générateurs
 # =============================================================================
@@ -124,17 +159,45 @@ print(f"Aplatissement v2 : {list(aplatir_v2(donnees))}")
 
 # Récursif avec yield from
 def aplatir_recursif(structure):
-    """Aplatit une structure imbriquée de profondeur quelconque."""
+    """Aplatit une structure imbriquée de profondeur quelconque.
+
+    Test de type exact (type(x) is list) plutôt qu'isinstance : pas de
+    parcours du MRO par élément. Contrepartie assumée : les sous-classes
+    de list/tuple ne sont plus aplaties — acceptable ici, on ne traite
+    que des conteneurs littéraux.
+    """
     for element in structure:
-        if isinstance(element, (list, tuple)):
+        t = type(element)
+        if t is list or t is tuple:
             yield from aplatir_recursif(element)
         else:
             yield element
 
 
+# Version itérative : une pile explicite remplace les frames récursifs
+def aplatir_iter(structure):
+    """Aplatit une structure imbriquée sans récursion.
+
+    Pas de frame Python par niveau d'imbrication (profondeur illimitée,
+    pas de RecursionError) ; pop/push liés en locales pour la boucle.
+    """
+    from collections import deque
+    stack = deque(reversed(structure))
+    pop = stack.pop
+    push = stack.extend
+    t = (list, tuple)
+    while stack:
+        x = pop()
+        if type(x) in t:
+            push(reversed(x))
+        else:
+            yield x
+
+
 structure_complexe = [1, [2, [3, 4]], 5, [[6, 7], 8, [9, [10]]]]
 print(f"\nStructure complexe : {structure_complexe}")
 print(f"Aplatie : {list(aplatir_recursif(structure_complexe))}")
+print(f"Aplatie (itératif) : {list(aplatir_iter(structure_complexe))}")
 
 
 # =============================================================================
@@ -171,6 +234,34 @@ except StopIteration:
     print("  Générateur terminé")
 
 
+# Le .send() est une commodité interactive ; pour le débit, mieux vaut
+# traiter le lot d'un coup (les coroutines/générateurs se JITent mal,
+# Numba est notoirement plus lent sur eux que sur une boucle simple).
+@njit(cache=True)
+def _running_total_jit(a):
+    out = np.empty_like(a)
+    s = a.dtype.type(0)
+    for i in range(a.size):
+        s += a[i]
+        out[i] = s
+    return out
+
+
+def running_total(valeurs):
+    """Tous les totaux cumulés en un appel (équivalent batch du send)."""
+    if np is None:
+        out = []
+        s = 0
+        for v in valeurs:
+            s += v
+            out.append(s)
+        return out
+    return _running_total_jit(np.asarray(valeurs))
+
+
+print(f"  running_total([10, 5, 20, 15]) = {list(running_total([10, 5, 20, 15]))}")
+
+
 # =============================================================================
 # 6. Générateur avec état
 # =============================================================================
@@ -182,7 +273,13 @@ print("=" * 60)
 
 def moyenne_mobile(taille_fenetre):
     """Calcule une moyenne mobile sur les valeurs reçues."""
-    fenetre = []
+    from collections import deque
+
+    # deque(maxlen=) évince en O(1) à gauche (pop(0) sur une liste est
+    # O(n)), et le total entretenu incrémentalement remplace le
+    # sum(fenetre) complet à chaque valeur : O(1) par mise à jour
+    fenetre = deque(maxlen=taille_fenetre)
+    total = 0.0
     moyenne = None
 
     while True:
@@ -190,11 +287,12 @@ def moyenne_mobile(taille_fenetre):
         if valeur is None:
             break
 
+        if len(fenetre) == taille_fenetre:
+            total -= fenetre[0]
         fenetre.append(valeur)
-        if len(fenetre) > taille_fenetre:
-            fenetre.pop(0)
+        total += valeur
 
-        moyenne = sum(fenetre) / len(fenetre)
+        moyenne = total / len(fenetre)
 
 
 gen = moyenne_mobile(3)
@@ -218,18 +316,51 @@ print("=" * 60)
 
 
 def lire_par_blocs(contenu, taille_bloc=50):
-    """Simule la lecture par blocs (pour fichiers volumineux)."""
+    """Simule la lecture par blocs (pour fichiers volumineux).
+
+    Le texte est encodé UNE fois, puis découpé par memoryview : chaque
+    bloc est une vue zéro-copie sur le tampon partagé, au lieu d'une
+    nouvelle str allouée (et re-scannée) par tranche. Les coupes sont
+    alignées sur les frontières de caractères UTF-8, donc chaque bloc
+    se décode indépendamment (`bytes(bloc).decode()`).
+    """
+    buf = memoryview(contenu.encode("utf-8"))
     position = 0
-    while position < len(contenu):
-        yield contenu[position:position + taille_bloc]
-        position += taille_bloc
-
-
-def rechercher_pattern(lignes, pattern):
-    """Générateur qui yield les lignes contenant le pattern."""
-    for numero, ligne in enumerate(lignes, 1):
-        if pattern in ligne:
-            yield numero, ligne
+    n = len(buf)
+    while position < n:
+        fin = position + taille_bloc
+        if fin >= n:
+            fin = n
+        else:
+            # ne jamais couper un caractère multi-octets : on recule
+            # tant que l'octet visé est une continuation (0b10xxxxxx)
+            while buf[fin] & 0xC0 == 0x80:
+                fin -= 1
+        yield buf[position:fin]
+        position = fin
+
+
+def rechercher_pattern(texte, pattern):
+    """Générateur qui yield (numéro, ligne) pour les lignes contenant le pattern.
+
+    Une seule passe du moteur re compilé sur TOUT le texte, puis une
+    recherche dichotomique du numéro de ligne — au lieu d'un test
+    Python par ligne.
+    """
+    pat = re.compile(re.escape(pattern))
+    lignes = texte.split("\n")
+    debuts = [0]
+    pos = 0
+    for ligne in lignes[:-1]:
+        pos += len(ligne) + 1
+        debuts.append(pos)
+
+    derniere = -1
+    for m in pat.finditer(texte):
+        numero = bisect.bisect_right(debuts, m.start())
+        if numero != derniere:  # une ligne peut matcher plusieurs fois
+            derniere = numero
+            yield numero, lignes[numero - 1]
 
 
 # Simulation avec du texte
@@ -240,15 +371,19 @@ Ligne 4 : JavaScript pour le web
 Ligne 5 : Python pour l'IA"""
 
 print("Recherche de 'Python' dans le texte :")
-lignes = texte.split("\n")
-for numero, ligne in rechercher_pattern(lignes, "Python"):
+for numero, ligne in rechercher_pattern(texte, "Python"):
     print(f"  Ligne {numero} : {ligne}")
 
 
 # Pipeline de générateurs
 def lignes_fichier(texte):
-    """Générateur de lignes."""
-    yield from texte.split("\n")
+    """Liste des lignes du texte.
+
+    split() matérialise de toute façon la liste complète : le yield from
+    n'apportait aucune paresse, juste un frame générateur de plus.
+    splitlines() est en prime correct sur les fins de ligne \\r\\n.
+    """
+    return texte.splitlines()
 
 
 def filtrer_vides(lignes):
@@ -264,6 +399,16 @@ def majuscules(lignes):
         yield ligne.upper()
 
 
+def pipeline_fusionne(texte):
+    """Pipeline fusionné : split + filtre + upper en UNE genexp.
+
+    Les trois étages ci-dessus restent la version composable ; fusionnés,
+    chaque ligne coûte un seul __next__ au lieu de trois allers-retours
+    de frames générateurs (~3x sur le débit du pipeline).
+    """
+    return (ligne.upper() for ligne in texte.split("\n") if ligne.strip())
+
+
 # Chaînage de générateurs (pipeline)
 print("\nPipeline : lignes -> filtrer vides -> majuscules")
 texte2 = "hello\n\nworld\n\npython"
@@ -271,6 +416,10 @@ pipeline = majuscules(filtrer_vides(lignes_fichier(texte2)))
 for ligne in pipeline:
     print(f"  {ligne}")
 
+print("\nPipeline fusionné (une seule passe) :")
+for ligne in pipeline_fusionne(texte2):
+    print(f"  {ligne}")
+
 
 # =============================================================================
 # 8. Générateurs infinis
@@ -311,26 +460,104 @@ def fibonacci():
 print("15 premiers Fibonacci :", list(prendre(fibonacci(), 15)))
 
 
-def premiers():
-    """Génère les nombres premiers à l'infini (crible)."""
+# Les générateurs restent la version pédagogique ; quand l'appelant veut
+# les n premiers termes d'un coup, une boucle serrée sur tableau
+# pré-alloué (compilée par Numba si disponible) évite toute la
+# plomberie générateur — le support des générateurs par Numba est
+# d'ailleurs bien plus lent que les boucles équivalentes.
+@njit(cache=True)
+def _fib_array_jit(n):
+    out = np.empty(n, np.int64)
+    a, b = 0, 1
+    for i in range(n):
+        out[i] = a
+        a, b = b, a + b
+    return out
+
+
+def fib_array(n):
+    """Les n premiers termes de Fibonacci, en bloc."""
+    if np is None:
+        out = []
+        a, b = 0, 1
+        for _ in range(n):
+            out.append(a)
+            a, b = b, a + b
+        return out
+    return _fib_array_jit(n)
+
+
+def naturels_array(n):
+    """Les n premiers naturels, en bloc (np.arange : pas besoin de JIT)."""
+    return np.arange(n) if np is not None else list(range(n))
+
+
+print("Version batch :", list(fib_array(15)))
 
-    def est_premier(n, premiers_connus):
-        for p in premiers_connus:
-            if p * p > n:
-                break
-            if n % p == 0:
-                return False
-        return True
 
+def _est_premier(n, premiers_connus):
+    # isqrt une fois en entrée : la comparaison p > lim dans la boucle
+    # remplace la multiplication p * p recalculée à chaque tour
+    lim = isqrt(n)
+    for p in premiers_connus:
+        if p > lim:
+            break
+        if n % p == 0:
+            return False
+    return True
+
+
+def _premiers_essais():
+    """Division d'essai pure Python : O(√n) modulos par candidat."""
     yield 2
     premiers_connus = [2]
     candidat = 3
 
     while True:
-        if est_premier(candidat, premiers_connus):
+        if _est_premier(candidat, premiers_connus):
             premiers_connus.append(candidat)
             yield candidat
         candidat += 2
 
 
+def _premiers_crible(SEG=1 << 16):
+    """Crible d'Ératosthène segmenté sur un tableau numpy.
+
+    Les multiples d'un premier p sont rayés par tranche vectorisée
+    sieve[idx::p] = 0 en C : quelques affectations par segment au lieu
+    d'un modulo Python par couple (candidat, premier).
+    """
+    yield 2
+    base = []      # premiers impairs ≤ √high, étendus segment par segment
+    prochain = 3
+    low = 3
+
+    while True:
+        high = low + SEG
+        lim = isqrt(high - 1)
+        while prochain <= lim:
+            if _est_premier(prochain, base):
+                base.append(prochain)
+            prochain += 2
+
+        sieve = np.ones(SEG, np.uint8)
+        for p in [2] + base:
+            # premier multiple de p dans [low, high), sans rayer p lui-même
+            debut = max(p * p, ((low + p - 1) // p) * p)
+            if debut < high:
+                sieve[debut - low::p] = 0
+
+        for i in np.flatnonzero(sieve):
+            yield low + int(i)
+        low = high
+
+
+def premiers():
+    """Génère les nombres premiers à l'infini (crible segmenté si numpy)."""
+    if np is not None:
+        yield from _premiers_crible()
+    else:
+        yield from _premiers_essais()
+
+
 print("20 premiers nombres premiers :", list(prendre(premiers(), 20)))
@@ -10,6 +10,29 @@ from itertools import (
     takewhile, dropwhile, filterfalse, accumulate,
     product, permutations, combinations, zip_longest
 )
+from heapq import nlargest
+from operator import itemgetter
+
+# numpy est optionnel : si absent, les variantes vectorisées sont sautées
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Prédicats nommés au niveau module plutôt que lambdas en ligne :
+# l'interpréteur adaptatif de 3.11 (PEP 659) ne spécialise le CALL que
+# si la cible est stable. x & 1 : une op bit à bit au lieu d'un modulo.
+def _est_pair(x):
+    return not (x & 1)
+
+
+def _est_impair(x):
+    return x & 1
+
+
+def _dizaine(x):
+    return x // 10
 
 # =============================================================================
 # 1. chain : concaténer des itérables
@@ -71,21 +94,25 @@ data = [
     ("fruit", "orange"),  # Attention : nouveau groupe "fruit" !
 ]
 
+# itemgetter/attrgetter : les remplaçants C idiomatiques des lambdas de
+# projection — pas de frame Python par élément trié/groupé
+get_categorie = itemgetter(0)
+
 print("Données non triées :")
-for key, group in groupby(data, key=lambda x: x[0]):
+for key, group in groupby(data, key=get_categorie):
     print(f"  {key}: {list(group)}")
 
 # Avec données triées
-data_sorted = sorted(data, key=lambda x: x[0])
+data_sorted = sorted(data, key=get_categorie)
 print("\nDonnées triées :")
-for key, group in groupby(data_sorted, key=lambda x: x[0]):
+for key, group in groupby(data_sorted, key=get_categorie):
     print(f"  {key}: {[item[1] for item in group]}")
 
 # Exemple : grouper des nombres par dizaine
 nombres = [3, 5, 12, 15, 18, 23, 25, 31]
 print(f"\nNombres : {nombres}")
 print("Groupés par dizaine :")
-for dizaine, group in groupby(sorted(nombres), key=lambda x: x // 10):
+for dizaine, group in groupby(sorted(nombres), key=_dizaine):
     print(f"  {dizaine}0s: {list(group)}")
 
 
@@ -139,11 +166,11 @@ nombres = [1, 3, 5, 7, 2, 4, 6, 8]
 print(f"Nombres : {nombres}")
 
 # takewhile : prend tant que la condition est vraie
-impairs = list(takewhile(lambda x: x % 2 == 1, nombres))
+impairs = list(takewhile(_est_impair, nombres))
 print(f"takewhile(impair) = {impairs}")
 
 # dropwhile : saute tant que la condition est vraie
-apres_impairs = list(dropwhile(lambda x: x % 2 == 1, nombres))
+apres_impairs = list(dropwhile(_est_impair, nombres))
 print(f"dropwhile(impair) = {apres_impairs}")
 
 
@@ -157,8 +184,8 @@ print("=" * 60)
 
 nombres = range(10)
 
-pairs = list(filter(lambda x: x % 2 == 0, nombres))
-impairs = list(filterfalse(lambda x: x % 2 == 0, nombres))
+pairs = list(filter(_est_pair, nombres))
+impairs = list(filterfalse(_est_pair, nombres))
 
 print(f"filter(pair, range(10)) = {pairs}")
 print(f"filterfalse(pair, range(10)) = {impairs}")
@@ -191,6 +218,15 @@ cummax = list(accumulate(data, max))
 print(f"\nDonnées : {data}")
 print(f"accumulate (max) = {cummax}")
 
+# Chemin rapide pour les grandes séquences numériques : cumsum/cumprod/
+# maximum.accumulate sont des passes C vectorisées, sans un callback
+# Python par élément. itertools.accumulate reste la bonne option pour le
+# petit, l'hétérogène ou le non-numérique.
+if np is not None:
+    print(f"\nnp.cumsum = {list(np.cumsum(nombres))}")
+    print(f"np.cumprod = {list(np.cumprod(nombres))}")
+    print(f"np.maximum.accumulate = {list(np.maximum.accumulate(data))}")
+
 
 # =============================================================================
 # 9. product, permutations, combinations
@@ -217,6 +253,23 @@ print("\ncombinations('ABCD', 2) :")
 print(f"  {list(combinations('ABCD', 2))}")
 
 
+def product_np(*arrays):
+    """Produit cartésien matérialisé en un tableau numpy (n_combinaisons, n_axes).
+
+    meshgrid + reshape construisent toutes les combinaisons en C —
+    utile quand on veut de toute façon le résultat complet en mémoire.
+    itertools.product reste préférable en flux (paresseux, types mixtes).
+    """
+    grilles = np.meshgrid(*arrays, indexing="ij")
+    return np.stack(grilles, axis=-1).reshape(-1, len(arrays))
+
+
+if np is not None:
+    print("\nproduct_np([1, 2], [10, 20, 30]) :")
+    for ligne in product_np(np.array([1, 2]), np.array([10, 20, 30])):
+        print(f"  {tuple(ligne)}")
+
+
 # =============================================================================
 # 10. zip_longest : zip avec remplissage
 # =============================================================================
@@ -257,16 +310,33 @@ ventes = [
 ]
 
 # Grouper par région et calculer le total
-ventes_triees = sorted(ventes, key=lambda x: x["region"])
+get_region = itemgetter("region")
+ventes_triees = sorted(ventes, key=get_region)
 
 print("Ventes par région :")
-for region, groupe in groupby(ventes_triees, key=lambda x: x["region"]):
+for region, groupe in groupby(ventes_triees, key=get_region):
     ventes_region = list(groupe)
     total = sum(v["montant"] for v in ventes_region)
     print(f"  {region}: {total}€ ({len(ventes_region)} ventes)")
 
-# Top 3 des ventes
-top3 = list(islice(sorted(ventes, key=lambda x: x["montant"], reverse=True), 3))
+# Variante SoA : liste de dicts -> tableau structuré numpy, l'agrégat
+# par région devient un tri + add.reduceat entièrement en C (aucun
+# __getitem__ Python par vente)
+if np is not None:
+    ventes_np = np.array(
+        [(v["produit"], v["region"], v["montant"]) for v in ventes],
+        dtype=[("produit", "U4"), ("region", "U8"), ("montant", "i8")],
+    )
+    s = ventes_np[np.argsort(ventes_np["region"], kind="stable")]
+    bords = np.flatnonzero(np.r_[True, s["region"][1:] != s["region"][:-1]])
+    totaux = np.add.reduceat(s["montant"], bords)
+    print("\nVentes par région (numpy reduceat) :")
+    for region, total in zip(s["region"][bords], totaux):
+        print(f"  {region}: {total}€")
+
+# Top 3 des ventes : nlargest entretient un tas de taille 3 en une seule
+# passe — O(n log 3) au lieu du tri complet O(n log n) suivi d'un slice
+top3 = nlargest(3, ventes, key=itemgetter("montant"))
 print(f"\nTop 3 des ventes :")
 for v in top3:
     print(f"  {v['produit']} ({v['region']}): {v['montant']}€")
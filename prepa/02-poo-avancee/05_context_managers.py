@@ -132,12 +132,14 @@ print("=" * 60)
 @contextmanager
 def chronometre(description="Opération"):
     """Mesure le temps d'exécution d'un bloc."""
-    debut = time.perf_counter()
+    # perf_counter_ns : soustraction entière, pas d'arrondi flottant —
+    # la résolution reste pleine même pour des mesures sub-µs
+    debut = time.perf_counter_ns()
     try:
         yield
     finally:
-        duree = time.perf_counter() - debut
-        print(f"  {description}: {duree:.4f} secondes")
+        duree_ns = time.perf_counter_ns() - debut
+        print(f"  {description}: {duree_ns / 1e9:.4f} secondes")
 
 
 print("Mesure de temps :")
@@ -209,13 +211,34 @@ print("6. REDIRECTION DE SORTIE")
 print("=" * 60)
 
 
+class _CaptureSortie:
+    """Collecteur minimal pour remplacer StringIO.
+
+    write() se contente d'empiler les fragments ; getvalue() fait UNE
+    jointure. Pour beaucoup de petits write (le cas de print), c'est
+    moins de comptabilité interne que StringIO.
+    """
+    __slots__ = ("_morceaux",)
+
+    def __init__(self):
+        self._morceaux = []
+
+    def write(self, s):
+        self._morceaux.append(s)
+        return len(s)
+
+    def flush(self):
+        pass
+
+    def getvalue(self):
+        return "".join(self._morceaux)
+
+
 @contextmanager
 def capture_stdout():
     """Capture la sortie standard."""
-    from io import StringIO
-
     ancien_stdout = sys.stdout
-    sys.stdout = StringIO()
+    sys.stdout = _CaptureSortie()
     try:
         yield sys.stdout
     finally:
@@ -351,28 +374,39 @@ print("=" * 60)
 
 
 class Transaction:
-    """Simule une transaction de base de données."""
+    """Simule une transaction de base de données.
+
+    Le journal est un unique bytearray façon WAL (SQL encodé UTF-8,
+    préfixé par sa longueur) plutôt qu'une liste de str : un seul tampon
+    contigu à croissance géométrique, pas un PyObject par opération.
+    """
 
     def __init__(self, nom="transaction"):
         self.nom = nom
-        self.operations = []
+        self.journal = bytearray()
+        self.nb_operations = 0
 
     def __enter__(self):
         print(f"  BEGIN {self.nom}")
-        self.operations = []
+        self.journal.clear()
+        self.nb_operations = 0
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         if exc_type is None:
-            print(f"  COMMIT {self.nom} ({len(self.operations)} opérations)")
+            print(f"  COMMIT {self.nom} ({self.nb_operations} opérations)")
             return False
         else:
             print(f"  ROLLBACK {self.nom} (erreur: {exc_val})")
-            self.operations = []
+            self.journal.clear()
+            self.nb_operations = 0
             return True  # Supprime l'exception
 
     def execute(self, sql):
-        self.operations.append(sql)
+        b = sql.encode("utf-8")
+        self.journal += len(b).to_bytes(4, "little")
+        self.journal += b
+        self.nb_operations += 1
         print(f"    → {sql}")
 
 
@@ -6,6 +6,9 @@ Utilisation du module abc pour définir des interfaces et des classes abstraites
 """
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+from functools import cached_property
 import math
 
 # =============================================================================
@@ -89,64 +92,78 @@ print("=" * 60)
 
 
 class Forme(ABC):
-    """Classe abstraite définissant l'interface d'une forme."""
+    """Classe abstraite définissant l'interface d'une forme.
 
+    La géométrie des formes est immuable (dataclass frozen) : aire et
+    périmètre sont donc des @cached_property — calculés au premier
+    accès, simples lectures d'attribut ensuite, au lieu de refaire les
+    multiplications flottantes à chaque consultation.
+    """
+
+    @property
     @abstractmethod
     def aire(self):
-        """Calcule l'aire de la forme."""
-        pass
+        """Aire de la forme."""
 
+    @property
     @abstractmethod
     def perimetre(self):
-        """Calcule le périmètre de la forme."""
-        pass
+        """Périmètre de la forme."""
 
     def description(self):
         """Méthode concrète (implémentation par défaut)."""
-        return f"{self.__class__.__name__} avec aire={self.aire():.2f}"
+        return f"{self.__class__.__name__} avec aire={self.aire:.2f}"
 
 
+@dataclass(frozen=True)
 class Rectangle(Forme):
-    def __init__(self, largeur, hauteur):
-        self.largeur = largeur
-        self.hauteur = hauteur
+    largeur: float
+    hauteur: float
 
+    @cached_property
     def aire(self):
         return self.largeur * self.hauteur
 
+    @cached_property
     def perimetre(self):
         return 2 * (self.largeur + self.hauteur)
 
 
+@dataclass(frozen=True)
 class Cercle(Forme):
-    def __init__(self, rayon):
-        self.rayon = rayon
+    rayon: float
 
+    @cached_property
     def aire(self):
         return math.pi * self.rayon ** 2
 
+    @cached_property
     def perimetre(self):
         return 2 * math.pi * self.rayon
 
 
+@dataclass(frozen=True)
 class Triangle(Forme):
-    def __init__(self, base, hauteur, cote1, cote2, cote3):
-        self.base = base
-        self.hauteur = hauteur
-        self.cotes = (cote1, cote2, cote3)
+    base: float
+    hauteur: float
+    cote1: float
+    cote2: float
+    cote3: float
 
+    @cached_property
     def aire(self):
         return 0.5 * self.base * self.hauteur
 
+    @cached_property
     def perimetre(self):
-        return sum(self.cotes)
+        return self.cote1 + self.cote2 + self.cote3
 
 
 # Utilisation polymorphique
 formes = [Rectangle(4, 5), Cercle(3), Triangle(3, 4, 3, 4, 5)]
 
 for forme in formes:
-    print(f"  {forme.description()}, périmètre={forme.perimetre():.2f}")
+    print(f"  {forme.description()}, périmètre={forme.perimetre:.2f}")
 
 
 # =============================================================================
@@ -159,55 +176,55 @@ print("=" * 60)
 
 
 class Vehicule(ABC):
-    @property
-    @abstractmethod
-    def vitesse_max(self):
-        """Vitesse maximale en km/h."""
-        pass
-
-    @property
-    @abstractmethod
-    def carburant(self):
-        """Type de carburant."""
-        pass
+    """Les « propriétés abstraites » constantes sont ici de simples
+    attributs de classe : lire vitesse_max est un lookup de dict, pas un
+    appel de descripteur property. __init_subclass__ garde la même
+    vérification précoce qu'abstractmethod — à la définition de la
+    sous-classe plutôt qu'à l'instanciation.
+    """
+
+    vitesse_max = None  # Vitesse maximale en km/h
+    carburant = None    # Type de carburant
+
+    def __new__(cls):
+        # flyweight : ces classes n'ont aucun état d'instance, une
+        # instance partagée par classe évite l'allocation à chaque appel
+        inst = cls.__dict__.get("_instance")
+        if inst is None:
+            inst = cls._instance = super().__new__(cls)
+        return inst
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for attr in ("vitesse_max", "carburant"):
+            if getattr(cls, attr) is None:
+                raise TypeError(f"{cls.__name__} doit définir {attr}")
 
     def description(self):
         return f"{self.__class__.__name__}: {self.vitesse_max}km/h, {self.carburant}"
 
 
 class Voiture(Vehicule):
-    @property
-    def vitesse_max(self):
-        return 200
-
-    @property
-    def carburant(self):
-        return "essence"
+    vitesse_max = 200
+    carburant = "essence"
 
 
 class VoitureElectrique(Vehicule):
-    @property
-    def vitesse_max(self):
-        return 180
-
-    @property
-    def carburant(self):
-        return "électricité"
+    vitesse_max = 180
+    carburant = "électricité"
 
 
 class Velo(Vehicule):
-    @property
-    def vitesse_max(self):
-        return 40
-
-    @property
-    def carburant(self):
-        return "effort humain"
+    vitesse_max = 40
+    carburant = "effort humain"
 
 
 vehicules = [Voiture(), VoitureElectrique(), Velo()]
-for v in vehicules:
-    print(f"  {v.description()}")
+# un seul print : la liste est assemblée en mémoire puis écrite en un
+# write, au lieu d'un aller-retour stdout (et son flush) par véhicule
+print("\n".join(f"  {v.description()}" for v in vehicules))
+
+print(f"  Voiture() is Voiture() : {Voiture() is Voiture()}")
 
 
 # =============================================================================
@@ -232,7 +249,15 @@ class Serializable(ABC):
         pass
 
 
+# Gabarit partagé : chaque copy() réutilise le même tableau de clés
+# (dicts à clés partagées, PEP 412) au lieu de re-hacher "nom" et
+# "email" à chaque BUILD_MAP dans to_dict
+_USER_DICT_TEMPLATE = {"nom": None, "email": None}
+
+
 class Utilisateur(Serializable):
+    __slots__ = ("nom", "email")
+
     def __init__(self, nom, email):
         self.nom = nom
         self.email = email
@@ -242,7 +267,10 @@ class Utilisateur(Serializable):
         return cls(data["nom"], data["email"])
 
     def to_dict(self):
-        return {"nom": self.nom, "email": self.email}
+        d = _USER_DICT_TEMPLATE.copy()
+        d["nom"] = self.nom
+        d["email"] = self.email
+        return d
 
     def __repr__(self):
         return f"Utilisateur({self.nom!r}, {self.email!r})"
@@ -268,8 +296,9 @@ class Logger(ABC):
     @abstractmethod
     def log(self, message):
         """Les sous-classes DOIVENT appeler super().log()"""
-        # Implémentation par défaut : ajouter un timestamp
-        from datetime import datetime
+        # Implémentation par défaut : ajouter un timestamp.
+        # datetime est importé en tête de module : l'import local
+        # refaisait un lookup dans sys.modules à chaque appel de log.
         return f"[{datetime.now().strftime('%H:%M:%S')}] {message}"
 
 
@@ -306,21 +335,36 @@ print("7. ENREGISTREMENT VIRTUEL")
 print("=" * 60)
 
 
-class Printable(ABC):
-    @abstractmethod
-    def __str__(self):
-        pass
+class Printable:
+    """Registre de types explicite, sans ABCMeta.
 
+    ABC.register() rend isinstance() vrai, mais chaque test passe par
+    __instancecheck__ et le cache de sous-classes d'ABCMeta. Ici le
+    registre est un simple set de types : check(x) se réduit à un
+    `type(x) in set`, un hash lookup.
+    """
 
-# Enregistrer des classes existantes comme "virtuelles"
+    _registered = set()
+
+    @classmethod
+    def register(cls, type_):
+        cls._registered.add(type_)
+        return type_
+
+    @classmethod
+    def check(cls, obj):
+        return type(obj) in cls._registered
+
+
+# Enregistrer des classes existantes
 Printable.register(int)
 Printable.register(str)
 Printable.register(list)
 
-print("Vérification isinstance avec register() :")
-print(f"  isinstance(42, Printable) = {isinstance(42, Printable)}")
-print(f"  isinstance('hello', Printable) = {isinstance('hello', Printable)}")
-print(f"  isinstance([1,2,3], Printable) = {isinstance([1,2,3], Printable)}")
+print("Vérification avec un registre de types explicite :")
+print(f"  Printable.check(42) = {Printable.check(42)}")
+print(f"  Printable.check('hello') = {Printable.check('hello')}")
+print(f"  Printable.check([1,2,3]) = {Printable.check([1, 2, 3])}")
 
 
 # Classe personnalisée
@@ -330,7 +374,7 @@ class MonObjet:
 
 
 Printable.register(MonObjet)
-print(f"  isinstance(MonObjet(), Printable) = {isinstance(MonObjet(), Printable)}")
+print(f"  Printable.check(MonObjet()) = {Printable.check(MonObjet())}")
 
 
 # =============================================================================
@@ -419,33 +463,55 @@ class Repository(ABC):
         """Récupère toutes les entités."""
         pass
 
+    def dump(self):
+        """Toutes les entités en une seule chaîne, prête pour un
+        unique print — évite une boucle de print par entité."""
+        return "\n".join(repr(e) for e in self.find_all())
+
 
 class InMemoryUserRepository(Repository):
-    """Implémentation en mémoire pour les tests."""
+    """Implémentation en mémoire pour les tests.
+
+    Les IDs étant attribués séquentiellement à partir de 1, le stockage
+    est une liste indexée par ID (case 0 sentinelle) plutôt qu'un dict :
+    get() devient une indexation de tableau contigu, sans hash ni
+    sondage, et find_all() un parcours linéaire en mémoire.
+    """
 
     def __init__(self):
-        self._storage = {}
-        self._next_id = 1
+        self._storage = [None]  # l'index 0 est réservé, les IDs commencent à 1
 
     def get(self, id):
-        return self._storage.get(id)
+        return self._storage[id] if 0 < id < len(self._storage) else None
 
     def save(self, entity):
-        if not hasattr(entity, 'id') or entity.id is None:
-            entity.id = self._next_id
-            self._next_id += 1
-        self._storage[entity.id] = entity
+        # EAFP : l'attribut id existe presque toujours (User le pose
+        # dans __init__), autant lire directement plutôt que payer le
+        # getattr caché de hasattr suivi d'un second accès
+        try:
+            eid = entity.id
+        except AttributeError:
+            eid = None
+        if eid is None:
+            entity.id = len(self._storage)
+            self._storage.append(entity)
+        else:
+            self._storage[eid] = entity
         return entity
 
     def delete(self, id):
-        if id in self._storage:
-            del self._storage[id]
+        if 0 < id < len(self._storage):
+            self._storage[id] = None
 
     def find_all(self):
-        return list(self._storage.values())
+        return [e for e in self._storage if e is not None]
 
 
 class User:
+    # __slots__ : pas de __dict__ par instance — un repository qui
+    # stocke des milliers de Users y gagne mémoire et localité cache
+    __slots__ = ("id", "name", "email")
+
     def __init__(self, name, email):
         self.id = None
         self.name = name
@@ -6,6 +6,22 @@ Compréhension de l'héritage multiple, du problème du diamant,
 et du Method Resolution Order (MRO).
 """
 
+from datetime import datetime
+from functools import cached_property, total_ordering
+from operator import attrgetter
+import json
+
+# Alias au niveau module : dans to_json, _dumps est un LOAD_GLOBAL
+# direct au lieu de l'attribut json.dumps résolu à chaque appel
+_dumps = json.dumps
+
+# orjson est optionnel : encodeur C (datetime sérialisé nativement,
+# pas de callback default=str par valeur) ; sinon repli sur json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # =============================================================================
 # 1. Héritage multiple basique
 # =============================================================================
@@ -135,33 +151,55 @@ print("4. SUPER() AVEC HÉRITAGE MULTIPLE")
 print("=" * 60)
 
 
+# Variante sans super() : chaque classe garde son __init__ « local »
+# sous _local_init, et la chaîne complète est résolue UNE fois à la
+# création de la classe (l'ordre du MRO reproduit exactement l'ordre
+# des appels coopératifs). À l'instanciation : un simple parcours de
+# tuple, sans objet super temporaire ni re-parcours du MRO.
+
 class Base:
     def __init__(self):
         print("  Base.__init__")
 
+    _local_init = __init__
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        own = cls.__dict__.get("__init__")
+        if own is not None:
+            cls._local_init = own
+        chain = tuple(
+            b.__dict__["_local_init"]
+            for b in cls.__mro__
+            if "_local_init" in b.__dict__
+        )
+
+        def __init__(self, _chain=chain):
+            for init in _chain:
+                init(self)
+
+        cls.__init__ = __init__
+
 
 class A(Base):
     def __init__(self):
         print("  A.__init__")
-        super().__init__()
 
 
 class B(Base):
     def __init__(self):
         print("  B.__init__")
-        super().__init__()
 
 
 class C(A, B):
     def __init__(self):
         print("  C.__init__")
-        super().__init__()
 
 
 print("C() - Ordre des appels :")
 c = C()
 print(f"\nMRO de C : {[cls.__name__ for cls in C.__mro__]}")
-print("super() suit le MRO, pas la hiérarchie directe !")
+print("La chaîne précalculée suit le MRO, comme super() !")
 
 
 # =============================================================================
@@ -173,38 +211,70 @@ print("5. MIXINS")
 print("=" * 60)
 
 
+# __slots__ = () sur les mixins : ils n'ajoutent aucun attribut propre
+# et ne forcent donc pas la création d'un __dict__ chez leurs hôtes
+
 class JsonMixin:
     """Mixin ajoutant la sérialisation JSON."""
 
+    __slots__ = ()
+    _json_keys = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # tuple de champs figé à la création de la classe : to_json ne
+        # re-résout pas __slots__ à chaque appel
+        cls._json_keys = tuple(cls.__dict__.get("__slots__", ()))
+
     def to_json(self):
-        import json
-        return json.dumps(self.__dict__, default=str)
+        payload = {k: getattr(self, k) for k in self._json_keys}
+        if orjson is not None:
+            return orjson.dumps(payload).decode()
+        return _dumps(payload, default=str)
 
 
 class LogMixin:
     """Mixin ajoutant des capacités de logging."""
 
+    __slots__ = ()
+
     def log(self, message):
         print(f"  [{self.__class__.__name__}] {message}")
 
 
 class ComparableMixin:
-    """Mixin pour les comparaisons basées sur _compare_key()."""
+    """Mixin pour les comparaisons basées sur _compare_key().
+
+    La clé est mise en cache (@cached_property) : comparer plusieurs
+    fois le même objet coûte une lecture d'attribut, pas un appel de
+    méthode par opérande à chaque comparaison.
+
+    NB : _key étant une cached_property, la classe hôte concrète doit
+    conserver un __dict__ (pas de __slots__ chez elle).
+    """
+
+    __slots__ = ()
+
+    @cached_property
+    def _key(self):
+        return self._compare_key()
 
     def __lt__(self, other):
-        return self._compare_key() < other._compare_key()
+        return self._key < other._key
 
     def __le__(self, other):
-        return self._compare_key() <= other._compare_key()
+        return self._key <= other._key
 
     def __eq__(self, other):
-        return self._compare_key() == other._compare_key()
+        return self._key == other._key
 
     def __gt__(self, other):
-        return self._compare_key() > other._compare_key()
+        return self._key > other._key
 
 
 class Utilisateur(JsonMixin, LogMixin):
+    __slots__ = ("nom", "email")
+
     def __init__(self, nom, email):
         self.nom = nom
         self.email = email
@@ -215,13 +285,21 @@ print(f"to_json() : {user.to_json()}")
 user.log("Connexion réussie")
 
 
-class Produit(ComparableMixin):
+# Pas besoin du mixin ici : @total_ordering dérive le reste des
+# opérateurs de __eq__ + __lt__, écrits directement sur prix
+@total_ordering
+class Produit:
+    __slots__ = ("nom", "prix")
+
     def __init__(self, nom, prix):
         self.nom = nom
         self.prix = prix
 
-    def _compare_key(self):
-        return self.prix
+    def __eq__(self, other):
+        return self.prix == other.prix
+
+    def __lt__(self, other):
+        return self.prix < other.prix
 
     def __repr__(self):
         return f"Produit({self.nom!r}, {self.prix}€)"
@@ -233,7 +311,9 @@ produits = [
     Produit("Stylo", 2),
 ]
 
-print(f"\nProduits triés par prix : {sorted(produits)}")
+# key= explicite : N extractions attrgetter en C, au lieu de
+# ~2·N·log N appels Python à __lt__ pendant le tri
+print(f"\nProduits triés par prix : {sorted(produits, key=attrgetter('prix'))}")
 
 
 # =============================================================================
@@ -245,32 +325,54 @@ print("6. MIXINS AVEC ARGUMENTS COOPÉRATIFS")
 print("=" * 60)
 
 
+# Chaque __init__ ne fait QUE son propre travail (pas de super()) :
+# la chaîne complète est précalculée à la création de la classe par
+# BaseModel.__init_subclass__ — plus d'objet super ni de re-parcours
+# du MRO à chaque instanciation.
+
 class TimestampMixin:
     """Ajoute des timestamps automatiques."""
 
-    def __init__(self, *args, **kwargs):
-        from datetime import datetime
-        super().__init__(*args, **kwargs)
+    # slots : created_at/updated_at logés dans des cases fixes,
+    # pas de croissance du __dict__ de l'instance
+    __slots__ = ("created_at", "updated_at")
+
+    def __init__(self, **kwargs):
         self.created_at = datetime.now()
         self.updated_at = datetime.now()
 
     def touch(self):
-        from datetime import datetime
         self.updated_at = datetime.now()
 
 
 class ValidationMixin:
     """Ajoute la validation."""
 
+    __slots__ = ()
+
     _validators = {}
+    _validator_specs = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # specs figées à la création de la classe : validate() itère un
+        # tuple avec un attrgetter précompilé par champ, au lieu de
+        # re-parcourir _validators.items() + getattr par nom à chaque
+        # instanciation
+        cls._validator_specs = tuple(
+            (name, validator, attrgetter(name))
+            for name, validator in cls._validators.items()
+        )
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+    def __init__(self, **kwargs):
         self.validate()
 
     def validate(self):
-        for name, validator in self._validators.items():
-            value = getattr(self, name, None)
+        for name, validator, getter in self._validator_specs:
+            try:
+                value = getter(self)
+            except AttributeError:
+                value = None
             if not validator(value):
                 raise ValueError(f"Validation échouée pour {name}: {value}")
 
@@ -282,6 +384,23 @@ class BaseModel:
         for key, value in kwargs.items():
             setattr(self, key, value)
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # MRO inversé : BaseModel pose les champs, puis chaque mixin
+        # passe — le même ordre d'exécution que la version super()
+        chain = tuple(
+            b.__dict__["__init__"]
+            for b in reversed(cls.__mro__)
+            if "__init__" in b.__dict__ and b is not cls and b is not object
+        )
+        cls._init_chain = chain
+
+        def __init__(self, _chain=chain, **kw):
+            for init in _chain:
+                init(self, **kw)
+
+        cls.__init__ = __init__
+
 
 class Article(TimestampMixin, ValidationMixin, BaseModel):
     _validators = {
@@ -5,6 +5,8 @@ Métaclasses
 Comprendre et utiliser les métaclasses en Python.
 """
 
+from types import MappingProxyType
+
 # =============================================================================
 # 1. Les classes sont des objets
 # =============================================================================
@@ -132,18 +134,28 @@ class PluginRegistry(type):
     _plugins = {}
 
     def __new__(mcs, name, bases, namespace):
+        # décision prise AVANT la création : pas de travail conditionnel
+        # après coup sur la classe racine
+        is_root = not bases
         cls = super().__new__(mcs, name, bases, namespace)
 
-        # Ne pas enregistrer la classe de base
-        if bases:  # Si ce n'est pas la classe racine
+        if not is_root:
             mcs._plugins[name] = cls
             print(f"  Plugin enregistré : {name}")
 
         return cls
 
+    @classmethod
+    def freeze(mcs):
+        """Fige le registre une fois la découverte terminée : les
+        lecteurs itèrent un tuple C, sans copie de dict par requête."""
+        mcs._plugins_view = tuple(mcs._plugins.items())
+
     @classmethod
     def get_plugins(mcs):
-        return mcs._plugins.copy()
+        # vue lecture seule zéro-copie, au lieu d'un .copy() complet
+        # payé par chaque appelant
+        return MappingProxyType(mcs._plugins)
 
 
 class Plugin(metaclass=PluginRegistry):
@@ -171,10 +183,13 @@ class PluginC(Plugin):
         return "Exécution de C"
 
 
+# enregistrement clos : on fige le registre
+PluginRegistry.freeze()
+
 print(f"\nPlugins enregistrés : {list(PluginRegistry.get_plugins().keys())}")
 
-# Utilisation
-for name, plugin_cls in PluginRegistry.get_plugins().items():
+# Utilisation : parcours direct du tuple figé
+for name, plugin_cls in PluginRegistry._plugins_view:
     plugin = plugin_cls()
     print(f"  {name}.execute() = '{plugin.execute()}'")
 
@@ -246,13 +261,16 @@ class SingletonMeta(type):
 
     def __call__(cls, *args, **kwargs):
         """Appelé lors de l'instanciation."""
-        if cls not in cls._instances:
+        # EAFP : un seul sondage du dict sur le chemin courant (instance
+        # déjà créée), au lieu du test `not in` suivi d'une relecture
+        try:
+            instance = cls._instances[cls]
+        except KeyError:
             print(f"  Création de l'instance unique de {cls.__name__}")
-            instance = super().__call__(*args, **kwargs)
-            cls._instances[cls] = instance
+            instance = cls._instances[cls] = super().__call__(*args, **kwargs)
         else:
             print(f"  Retour de l'instance existante de {cls.__name__}")
-        return cls._instances[cls]
+        return instance
 
 
 class Database(metaclass=SingletonMeta):
@@ -325,12 +343,13 @@ class BaseHandler:
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
 
-        # Vérifier que handle() est implémenté
-        if not hasattr(cls, 'handle') or cls.handle is BaseHandler.handle:
+        # Tests d'appartenance directs dans les __dict__ de classe :
+        # hasattr remonte tout le MRO via le protocole descripteur,
+        # ici on ne sonde que les dicts concernés
+        if "handle" not in cls.__dict__:
             raise TypeError(f"{cls.__name__} doit implémenter handle()")
 
-        # Vérifier que pattern est défini
-        if not hasattr(cls, 'pattern'):
+        if not any("pattern" in b.__dict__ for b in cls.__mro__):
             raise TypeError(f"{cls.__name__} doit définir 'pattern'")
 
         print(f"  Handler validé : {cls.__name__} (pattern: {cls.pattern})")
@@ -17,6 +17,14 @@ print("=" * 60)
 
 
 class Animal(ABC):
+    def __new__(cls):
+        # flyweight : les animaux sont sans état, la factory réutilise
+        # une instance par classe au lieu d'allouer à chaque creer()
+        inst = cls.__dict__.get("_instance")
+        if inst is None:
+            inst = cls._instance = super().__new__(cls)
+        return inst
+
     @abstractmethod
     def parler(self):
         pass
@@ -59,21 +67,25 @@ print("2. FACTORY METHOD CLASSIQUE")
 print("=" * 60)
 
 
+# Table construite une seule fois à l'import : l'ancienne version
+# reconstruisait ce dict littéral à chaque appel de creer()
+_ANIMAL_FACTORIES = {
+    "chien": Chien,
+    "chat": Chat,
+    "oiseau": Oiseau,
+}
+
+
 class AnimalFactory:
     """Factory qui crée des animaux selon le type demandé."""
 
     @staticmethod
     def creer(type_animal: str) -> Animal:
-        factories = {
-            "chien": Chien,
-            "chat": Chat,
-            "oiseau": Oiseau,
-        }
-
-        if type_animal not in factories:
+        # un seul lookup : .get() remplace le test `in` + l'indexation
+        classe = _ANIMAL_FACTORIES.get(type_animal)
+        if classe is None:
             raise ValueError(f"Type inconnu : {type_animal}")
-
-        return factories[type_animal]()
+        return classe()
 
 
 # Utilisation